@@ -1,7 +1,6 @@
 import bpy
 import bmesh
 import numpy as np
-from mathutils import Vector
 import os
 import sys
 import json
@@ -13,6 +12,12 @@ class PrintingType(Enum):
     SLA = "SLA"
     GENERAL = "GENERAL"
 
+def edge_face_counts(mesh):
+    """Number of faces using each edge, read through foreach_get instead of a bmesh"""
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    return np.bincount(loop_edges, minlength=len(mesh.edges))
+
 class MeshRepairOpenVDB:
     """
     Advanced mesh repair using OpenVDB voxelization in Blender.
@@ -27,12 +32,8 @@ class MeshRepairOpenVDB:
         
     def clear_scene(self):
         """Clear all mesh objects from the scene"""
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete(use_global=False)
-        
-        # Clear orphan data
-        for mesh in bpy.data.meshes:
-            bpy.data.meshes.remove(mesh)
+        # Remove objects and their mesh data in one batch, without the select/delete operators
+        bpy.data.batch_remove(ids=[*bpy.data.objects, *bpy.data.meshes])
             
     def import_stl(self):
         """Import STL file with version compatibility"""
@@ -96,48 +97,37 @@ class MeshRepairOpenVDB:
         """Analyze mesh to determine optimal parameters"""
         mesh = obj.data
         
-        # Calculate bounding box diagonal
-        bbox_corners = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-        bbox_min = Vector((min(c.x for c in bbox_corners),
-                          min(c.y for c in bbox_corners),
-                          min(c.z for c in bbox_corners)))
-        bbox_max = Vector((max(c.x for c in bbox_corners),
-                          max(c.y for c in bbox_corners),
-                          max(c.z for c in bbox_corners)))
-        bbox_diagonal = (bbox_max - bbox_min).length
-        
-        # Calculate mesh statistics
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-        bm.verts.ensure_lookup_table()
-        bm.edges.ensure_lookup_table()
+        # Calculate bounding box diagonal from the world-space bound_box corners
+        matrix = np.array(obj.matrix_world, dtype=np.float64)
+        corners = np.array(obj.bound_box, dtype=np.float64) @ matrix[:3, :3].T + matrix[:3, 3]
+        bbox_diagonal = float(np.linalg.norm(corners.max(axis=0) - corners.min(axis=0)))
+        
+        # Read vertex coordinates and edge vertex pairs in bulk
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3).astype(np.float64)
+        edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+        mesh.edges.foreach_get("vertices", edge_verts)
+        edge_verts = edge_verts.reshape(-1, 2)
         
         # Find minimum edge length for detail preservation
-        min_edge_length = float('inf')
-        avg_edge_length = 0
-        edge_count = 0
-        
-        for edge in bm.edges:
-            length = edge.calc_length()
-            if length > 0:  # Avoid zero-length edges
-                min_edge_length = min(min_edge_length, length)
-            avg_edge_length += length
-            edge_count += 1
-            
-        if min_edge_length == float('inf'):
+        lengths = np.linalg.norm(co[edge_verts[:, 1]] - co[edge_verts[:, 0]], axis=1)
+        nonzero_lengths = lengths[lengths > 0]  # Avoid zero-length edges
+        
+        if nonzero_lengths.size:
+            min_edge_length = float(nonzero_lengths.min())
+        else:
             min_edge_length = bbox_diagonal * 0.001
             
-        avg_edge_length = avg_edge_length / edge_count if edge_count > 0 else bbox_diagonal * 0.01
+        avg_edge_length = float(lengths.mean()) if lengths.size else bbox_diagonal * 0.01
         
-        # Detect non-manifold edges
-        non_manifold_edges = [e for e in bm.edges if not e.is_manifold]
-        non_manifold_count = len(non_manifold_edges)
+        faces_per_edge = edge_face_counts(mesh)
         
-        # Detect holes (boundary edges)
-        boundary_edges = [e for e in bm.edges if e.is_boundary]
-        hole_count = len(boundary_edges)
+        # Detect non-manifold edges (not shared by exactly two faces)
+        non_manifold_count = int(np.count_nonzero(faces_per_edge != 2))
         
-        bm.free()
+        # Detect holes (boundary edges)
+        hole_count = int(np.count_nonzero(faces_per_edge == 1))
         
         print(f"Mesh Analysis:")
         print(f"  - Vertices: {len(mesh.vertices)}")
@@ -209,26 +199,25 @@ class MeshRepairOpenVDB:
         """Pre-process mesh to remove obvious defects"""
         print("Pre-processing mesh...")
         
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        
-        # Enter edit mode
-        bpy.ops.object.mode_set(mode='EDIT')
-        
-        # Select all
-        bpy.ops.mesh.select_all(action='SELECT')
+        # Work on a bmesh directly instead of toggling edit mode for each operator
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
         
         # Remove doubles/duplicate vertices
-        bpy.ops.mesh.remove_doubles(threshold=0.0001)
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
         
-        # Delete loose vertices and edges
-        bpy.ops.mesh.delete_loose()
+        # Delete loose edges, then the vertices they leave behind and any loose vertices
+        loose_edges = [e for e in bm.edges if e.is_wire]
+        bmesh.ops.delete(bm, geom=loose_edges, context='EDGES')
+        loose_verts = [v for v in bm.verts if not v.link_edges]
+        bmesh.ops.delete(bm, geom=loose_verts, context='VERTS')
         
         # Fix normals
-        bpy.ops.mesh.normals_make_consistent(inside=False)
+        bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
         
-        # Return to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
+        bm.to_mesh(obj.data)
+        bm.free()
+        obj.data.update()
         
         print("Pre-processing complete")
     
@@ -348,23 +337,19 @@ class MeshRepairOpenVDB:
         """Validate the repaired mesh"""
         print("Validating repaired mesh...")
         
-        mesh = obj.data
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
+        faces_per_edge = edge_face_counts(obj.data)
         
         # Check for non-manifold geometry
-        non_manifold = [e for e in bm.edges if not e.is_manifold]
+        non_manifold = int(np.count_nonzero(faces_per_edge != 2))
         
         # Check for boundaries (holes)
-        boundaries = [e for e in bm.edges if e.is_boundary]
-        
-        bm.free()
+        boundaries = int(np.count_nonzero(faces_per_edge == 1))
         
-        is_valid = len(non_manifold) == 0 and len(boundaries) == 0
+        is_valid = non_manifold == 0 and boundaries == 0
         
         print(f"Validation Results:")
-        print(f"  - Is Watertight: {len(boundaries) == 0}")
-        print(f"  - Is Manifold: {len(non_manifold) == 0}")
+        print(f"  - Is Watertight: {boundaries == 0}")
+        print(f"  - Is Manifold: {non_manifold == 0}")
         print(f"  - Overall Valid: {is_valid}")
         
         return is_valid
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+build.py - Package script.py as ring_emboss.pyz with precompiled bytecode
+Runs in Blender with: blender --background --factory-startup --python build.py
+Compiling with Blender's own Python keeps the bytecode version in sync with it.
+"""
+
+import sys
+import zipapp
+import py_compile
+import tempfile
+from pathlib import Path
+
+
+def main():
+    """Compile script.py and store only the bytecode in a zipapp"""
+    here = Path(__file__).resolve().parent
+    target = here / "ring_emboss.pyz"
+    
+    with tempfile.TemporaryDirectory() as staging:
+        py_compile.compile(str(here / "script.py"), cfile=str(Path(staging) / "script.pyc"), doraise=True)
+        zipapp.create_archive(staging, target, main="script:main")
+    
+    print(f"Built {target} with Python {sys.version.split()[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+client.py - Send a ring config to a running ring-emboss daemon
+Start the daemon with: blender --background --python script.py -- --daemon
+Then run: python3 client.py config.json [--no-cache]
+"""
+
+import sys
+import json
+import socket
+from pathlib import Path
+
+SOCKET_PATH = "/tmp/ring-emboss.sock"
+
+
+def main():
+    """Forward the config path to the daemon and exit with its exit code"""
+    argv = sys.argv[1:]
+    no_cache = "--no-cache" in argv
+    argv = [arg for arg in argv if arg != "--no-cache"]
+    
+    if len(argv) < 1:
+        print("ERROR: No config file specified. Usage: python3 client.py config.json [--no-cache]")
+        sys.exit(1)
+    
+    # The daemon has its own working directory, so send an absolute path
+    request = {"config": str(Path(argv[0]).resolve()), "no_cache": no_cache}
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(SOCKET_PATH)
+            conn.sendall(json.dumps(request).encode() + b'\n')
+            with conn.makefile('rb') as f:
+                reply = json.loads(f.readline())
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Could not reach ring daemon at {SOCKET_PATH}: {e}")
+        sys.exit(2)
+    
+    if reply.get('class'):
+        print(f"ERROR: Ring generation failed with {reply['class']}")
+    
+    sys.exit(reply['code'])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+blender --background --python-expr "import sys; sys.path.insert(0, 'ring_emboss.pyz'); import script; script.main()" -- config.json
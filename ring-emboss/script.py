@@ -10,33 +10,459 @@ import sys
 import json
 import os
 import math
+import copy
+import functools
+import hashlib
+import queue
+import threading
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from mathutils import Vector, Matrix
-import traceback
+
+# orjson parses and serializes faster when installed; stdlib json is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+def _dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+# NumPy and traceback are imported inside the functions that use them,
+# so usage errors and daemon startup exit before loading them
+
+# Numba is optional; the compiled ring kernel is created on first use
+_ring_kernel = None
+
+
+def _get_ring_kernel():
+    """Return the Numba-compiled ring kernel, or None if Numba is unavailable"""
+    global _ring_kernel
+    if _ring_kernel is None:
+        _ring_kernel = False
+        try:
+            import numba
+        except ImportError:
+            return None
+
+        def _ring_arrays_kernel(inner_r, outer_r, length, R, V, cos_tab, sin_tab, verts, faces):
+            """Fill ring vertex and quad index arrays in place (compiled by Numba)"""
+            verts_per_ring = 2 * R
+
+            # Vertices: outer circle then inner circle for every height
+            for v_idx in numba.prange(V + 1):
+                z = -length / 2 + (length * v_idx / V)
+                base = v_idx * verts_per_ring
+                for r_idx in range(R):
+                    verts[base + r_idx, 0] = outer_r * cos_tab[r_idx]
+                    verts[base + r_idx, 1] = outer_r * sin_tab[r_idx]
+                    verts[base + r_idx, 2] = z
+                    verts[base + R + r_idx, 0] = inner_r * cos_tab[r_idx]
+                    verts[base + R + r_idx, 1] = inner_r * sin_tab[r_idx]
+                    verts[base + R + r_idx, 2] = z
+
+            # Side faces: outer block followed by inner block
+            side = V * R
+            for v_idx in numba.prange(V):
+                ring_offset = v_idx * verts_per_ring
+                next_ring_offset = ring_offset + verts_per_ring
+                for r_idx in range(R):
+                    next_r = (r_idx + 1) % R
+                    f = v_idx * R + r_idx
+                    faces[f, 0] = ring_offset + r_idx
+                    faces[f, 1] = ring_offset + next_r
+                    faces[f, 2] = next_ring_offset + next_r
+                    faces[f, 3] = next_ring_offset + r_idx
+                    faces[side + f, 0] = ring_offset + R + r_idx
+                    faces[side + f, 1] = next_ring_offset + R + r_idx
+                    faces[side + f, 2] = next_ring_offset + R + next_r
+                    faces[side + f, 3] = ring_offset + R + next_r
+
+            # Top and bottom faces
+            top_offset = V * verts_per_ring
+            for r_idx in numba.prange(R):
+                next_r = (r_idx + 1) % R
+                f = 2 * side + r_idx
+                faces[f, 0] = top_offset + r_idx
+                faces[f, 1] = top_offset + next_r
+                faces[f, 2] = top_offset + R + next_r
+                faces[f, 3] = top_offset + R + r_idx
+                faces[f + R, 0] = r_idx
+                faces[f + R, 1] = R + r_idx
+                faces[f + R, 2] = R + next_r
+                faces[f + R, 3] = next_r
+
+        # Numba can only cache kernels of a source file on disk, not of the bytecode in ring_emboss.pyz
+        cache = os.path.isfile(__file__)
+        try:
+            _ring_kernel = numba.njit(parallel=True, cache=cache, fastmath=True)(_ring_arrays_kernel)
+        except Exception as e:
+            # cache=True raises here when no writable cache directory can be found
+            print(f"Warning: Could not set up Numba ring kernel, using NumPy instead: {e}")
+    return _ring_kernel or None
+
+
+def _build_ring_verts(radius, length, R, V, cos_tab, sin_tab):
+    """Vertices of one circle per height, shape (V + 1, R, 3)"""
+    import numpy as np
+    verts = np.empty((V + 1, R, 3), dtype=np.float32)
+    verts[..., 0] = radius * cos_tab
+    verts[..., 1] = radius * sin_tab
+    verts[..., 2] = (-length / 2 + length * np.arange(V + 1) / V)[:, None]
+    return verts
+
+
+def _build_outer_faces(V, R, verts_per_ring):
+    """Outer wall quads, shape (V * R, 4)"""
+    import numpy as np
+    r = np.arange(R, dtype=np.int32)
+    next_r = (r + 1) % R
+    ring_offset = (np.arange(V, dtype=np.int32) * verts_per_ring)[:, None]
+    next_ring_offset = ring_offset + verts_per_ring
+    return np.stack([ring_offset + r, ring_offset + next_r,
+                     next_ring_offset + next_r, next_ring_offset + r], axis=-1).reshape(-1, 4)
+
+
+def _build_inner_faces(V, R, verts_per_ring):
+    """Inner wall quads, shape (V * R, 4)"""
+    import numpy as np
+    r = np.arange(R, dtype=np.int32)
+    next_r = (r + 1) % R
+    ring_offset = (np.arange(V, dtype=np.int32) * verts_per_ring)[:, None] + R
+    next_ring_offset = ring_offset + verts_per_ring
+    return np.stack([ring_offset + r, next_ring_offset + r,
+                     next_ring_offset + next_r, ring_offset + next_r], axis=-1).reshape(-1, 4)
+
+
+def _build_top_face(V, R, verts_per_ring):
+    """Top cap quads, shape (R, 4)"""
+    import numpy as np
+    r = np.arange(R, dtype=np.int32) + V * verts_per_ring
+    next_r = (np.arange(R, dtype=np.int32) + 1) % R + V * verts_per_ring
+    return np.stack([r, next_r, R + next_r, R + r], axis=-1)
+
+
+def _build_bottom_face(V, R, verts_per_ring):
+    """Bottom cap quads, shape (R, 4)"""
+    import numpy as np
+    r = np.arange(R, dtype=np.int32)
+    next_r = (r + 1) % R
+    return np.stack([r, R + r, R + next_r, next_r], axis=-1)
+
+
+def _build_ring_arrays_numpy(inner_r, outer_r, length, R, V):
+    """NumPy fallback for build_ring_arrays, same layout as the Numba kernel
+
+    The wall and cap blocks are independent, so they are built on worker
+    threads; NumPy releases the GIL inside its array operations.
+    """
+    import numpy as np
+    angles = 2 * np.pi * np.arange(R) / R
+    cos_tab = np.cos(angles)
+    sin_tab = np.sin(angles)
+    verts_per_ring = 2 * R
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        outer_verts = pool.submit(_build_ring_verts, outer_r, length, R, V, cos_tab, sin_tab)
+        inner_verts = pool.submit(_build_ring_verts, inner_r, length, R, V, cos_tab, sin_tab)
+        face_blocks = [pool.submit(build, V, R, verts_per_ring)
+                       for build in (_build_outer_faces, _build_inner_faces,
+                                     _build_top_face, _build_bottom_face)]
+        verts = np.stack([outer_verts.result(), inner_verts.result()], axis=1)
+        faces = np.concatenate([block.result() for block in face_blocks])
+
+    return verts.reshape(-1, 3), faces
+
+
+def build_ring_arrays(inner_r, outer_r, length, R, V):
+    """Build ring vertices (float32[N,3]) and quad faces (int32[M,4])"""
+    global _ring_kernel
+    import numpy as np
+    kernel = _get_ring_kernel()
+    if kernel is not None:
+        angles = 2 * np.pi * np.arange(R) / R
+        verts = np.empty(((V + 1) * 2 * R, 3), dtype=np.float32)
+        faces = np.empty((2 * V * R + 2 * R, 4), dtype=np.int32)
+        try:
+            kernel(inner_r, outer_r, length, R, V, np.cos(angles), np.sin(angles), verts, faces)
+            return verts, faces
+        except Exception as e:
+            # Compilation happens on the first call, so typing or cache errors show up here
+            print(f"Warning: Numba ring kernel failed, using NumPy instead: {e}")
+            _ring_kernel = False
+    
+    return _build_ring_arrays_numpy(inner_r, outer_r, length, R, V)
+
+
+def fill_mesh(mesh, verts, loop_verts, loop_start):
+    """Fill an empty mesh from flat vertex, loop and polygon buffers"""
+    import numpy as np
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(len(loop_verts))
+    mesh.polygons.add(len(loop_start))
+    mesh.attributes["position"].data.foreach_set("vector", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loop_verts, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(loop_start, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+
+def clean_mesh(mesh, merge_distance=None, others=()):
+    """Optionally join other meshes into mesh and merge close vertices, then make face normals point outward"""
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    # from_mesh appends to the bmesh, so the other meshes are joined without an intermediate copy
+    for other in others:
+        bm.from_mesh(other)
+    if merge_distance is not None:
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+
+def write_stl_binary(path, verts, tris):
+    """Write indexed triangles to a binary STL file"""
+    import numpy as np
+    corners = verts[tris]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+    
+    records = np.zeros(len(tris), dtype=[('normal', '<f4', (3,)), ('verts', '<f4', (3, 3)), ('attr', '<u2')])
+    records['normal'] = normals
+    records['verts'] = corners
+    
+    with open(path, 'wb') as f:
+        f.write(b'Binary STL written by ring-emboss script.py'.ljust(80, b' '))
+        np.array([len(tris)], dtype='<u4').tofile(f)
+        records.tofile(f)
+
+
+_POSITIVE = {'type': 'number', 'exclusiveMinimum': 0}
+
+CONFIG_SCHEMA = {
+    'type': 'object',
+    'required': ['ring', 'text', 'output'],
+    'properties': {
+        'ring': {
+            'type': 'object',
+            'required': ['inner_diameter', 'outer_diameter', 'length'],
+            'properties': {
+                'inner_diameter': _POSITIVE,
+                'outer_diameter': _POSITIVE,
+                'length': _POSITIVE,
+                'radial_segments': {'type': 'integer', 'minimum': 128},
+                'vertical_segments': {'type': 'integer', 'minimum': 32},
+            },
+        },
+        'text': {
+            'type': 'object',
+            'required': ['content', 'font_path', 'font_size', 'depth', 'direction'],
+            'properties': {
+                'content': {'type': 'string'},
+                'font_path': {'type': 'string'},
+                'font_size': _POSITIVE,
+                'depth': _POSITIVE,
+                'direction': {'enum': ['normal', 'inverted']},
+            },
+        },
+        'output': {
+            'type': 'object',
+            'required': ['stl_filename'],
+            'properties': {
+                'stl_filename': {'type': 'string'},
+                'report_filename': {'type': 'string'},
+                'create_parent_dirs': {'type': 'boolean'},
+                'force': {'type': 'boolean'},
+            },
+        },
+        'material': {
+            'type': 'object',
+            'properties': {
+                'name': {'type': 'string'},
+                'density': _POSITIVE,
+            },
+        },
+    },
+}
+
+_SCHEMA_TYPES = {
+    'object': dict,
+    'string': str,
+    'number': (int, float),
+    'integer': int,
+    'boolean': bool,
+}
+
+# fastjsonschema is optional; the compiled validator is created on first use
+_config_validator = None
+
+
+def _check_schema(schema, value, path='data'):
+    """Minimal JSON Schema check for the keywords used by CONFIG_SCHEMA"""
+    if 'type' in schema:
+        expected = schema['type']
+        if isinstance(value, bool) and expected != 'boolean' or not isinstance(value, _SCHEMA_TYPES[expected]):
+            raise ValueError(f"{path} must be {expected}")
+    if 'enum' in schema and value not in schema['enum']:
+        raise ValueError(f"{path} must be one of {schema['enum']}")
+    if 'exclusiveMinimum' in schema and value <= schema['exclusiveMinimum']:
+        raise ValueError(f"{path} must be bigger than {schema['exclusiveMinimum']}")
+    if 'minimum' in schema and value < schema['minimum']:
+        raise ValueError(f"{path} must be bigger than or equal to {schema['minimum']}")
+    for key in schema.get('required', ()):
+        if key not in value:
+            raise ValueError(f"{path} must contain ['{key}'] properties")
+    for key, subschema in schema.get('properties', {}).items():
+        if key in value:
+            _check_schema(subschema, value[key], f"{path}.{key}")
+    return value
+
+
+def _get_config_validator():
+    """Return a validator for CONFIG_SCHEMA that raises ValueError on failure"""
+    global _config_validator
+    if _config_validator is None:
+        try:
+            import fastjsonschema
+        except ImportError:
+            _config_validator = lambda config: _check_schema(CONFIG_SCHEMA, config)
+        else:
+            _config_validator = fastjsonschema.compile(CONFIG_SCHEMA)
+    return _config_validator
+
+
+# Exit codes for exceptions escaping run(); anything else is a Blender operation error (3)
+EXIT_CODES = {
+    OSError: 2,  # File I/O error
+    json.JSONDecodeError: 1,  # Input validation error
+    MemoryError: 5,  # Out of memory
+}
+
+
+def exit_code_for(exc):
+    """Look up the exit code for an unexpected exception"""
+    return next((code for exc_type, code in EXIT_CODES.items() if isinstance(exc, exc_type)), 3)
+
+
+def lazy_traceback(exc):
+    """Return a callable that formats the traceback of exc when it is logged"""
+    import traceback
+    return lambda: f"Traceback: {''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))}"
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config(data):
+    """Parse config JSON, memoized on the file contents for repeated daemon jobs"""
+    return _loads(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _schema_error(data):
+    """Check config JSON against CONFIG_SCHEMA, memoized like _parse_config
+
+    Returns the error message, or None when the config is structurally valid.
+    """
+    try:
+        _get_config_validator()(_parse_config(data))
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+# Bump when validate_config changes what it stores in the config dict
+CONFIG_CACHE_VERSION = 1
+
+# Bump when a code change alters the generated geometry, so existing outputs are rebuilt
+GENERATOR_VERSION = 1
+
 
 class RingTextGenerator:
-    def __init__(self, config_path):
+    def __init__(self, config_path, use_cache=True, keep_fonts=False):
         self.config_path = Path(config_path).resolve()
         self.config_dir = self.config_path.parent
         self.config = None
-        self.log_messages = []
+        self.use_cache = use_cache
+        self.keep_fonts = keep_fonts  # The daemon keeps loaded fonts between jobs
+        self.cache_path = Path(f"{self.config_path}.cache.json")
+        self._cache_key = None
+        self._config_data = None
+        self.config_validated = False
+        self.error_class = None  # Name of the exception that ended run(), if any
+        self.log_messages = deque(maxlen=10000)  # Most recent lines only
         self.log_file = None
         self.report_data = {}  # Store data for JSON report
+        self._triangles = None  # Triangulated final mesh, shared by volume and export
         
-    def log(self, message, level="INFO"):
-        """Log message to console and file"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        formatted_msg = f"[{timestamp}] [{level}] {message}"
-        print(formatted_msg)
-        self.log_messages.append(formatted_msg)
+        # Console and file output happen on a background thread
+        self._log_queue = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+        self._log_thread.start()
         
-        if self.log_file:
-            try:
-                with open(self.log_file, 'a') as f:
-                    f.write(formatted_msg + '\n')
-            except Exception as e:
-                print(f"Warning: Could not write to log file: {e}")
+    def log(self, message, level="INFO"):
+        """Log message to console and file
+
+        message may be a callable returning the text; it is called on the log
+        thread, so expensive formatting stays off the generation path.
+        """
+        self._log_queue.put((datetime.now(), level, message))
+    
+    def _log_worker(self):
+        """Print queued messages and append them to the log file once it is set up"""
+        log_handle = None
+        try:
+            while True:
+                item = self._log_queue.get()
+                if item is None:
+                    break
+                
+                if isinstance(item, Path):
+                    try:
+                        log_handle = open(item, 'a', encoding='utf-8', buffering=1 << 16)
+                    except Exception as e:
+                        print(f"Warning: Could not open log file: {e}")
+                    continue
+                
+                when, level, message = item
+                if callable(message):
+                    message = message()
+                timestamp = when.strftime("%Y-%m-%d %H:%M:%S")
+                formatted_msg = f"[{timestamp}] [{level}] {message}"
+                self.log_messages.append(formatted_msg)
+                
+                print(formatted_msg)
+                if log_handle:
+                    try:
+                        log_handle.write(formatted_msg + '\n')
+                    except Exception as e:
+                        print(f"Warning: Could not write to log file: {e}")
+                        try:
+                            log_handle.close()
+                        except Exception:
+                            pass
+                        log_handle = None
+        finally:
+            # Flushes the buffered handle, even if a message callable raised
+            if log_handle:
+                log_handle.close()
+    
+    def close_log(self):
+        """Flush pending log messages and stop the log thread
+
+        The join has no timeout: the sentinel is always reached, and returning
+        earlier would leave queued lines unwritten and the log file unflushed.
+        """
+        self._log_queue.put(None)
+        self._log_thread.join()
     
     def setup_log_file(self):
         """Initialize log file from config"""
@@ -64,12 +490,26 @@ class RingTextGenerator:
             except Exception as e:
                 print(f"Warning: Could not create log file: {e}")
                 self.log_file = None
+                return
+            
+            # Messages logged from now on are also written to the file
+            self._log_queue.put(self.log_file)
     
     def load_config(self):
         """Load and parse configuration JSON"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            stat = self.config_path.stat()
+            self._cache_key = [CONFIG_CACHE_VERSION, str(self.config_path), stat.st_mtime_ns, stat.st_size]
+            
+            # Reuse the validated config from a previous run if the file is unchanged
+            if self.use_cache and self.read_config_cache():
+                self.setup_log_file()
+                self.log(f"Loaded validated config from cache {self.cache_path}")
+                return True
+            
+            # validate_config mutates the config, so work on a copy of the memoized dict
+            self._config_data = self.config_path.read_bytes()
+            self.config = copy.deepcopy(_parse_config(self._config_data))
             
             self.setup_log_file()
             self.log(f"Successfully loaded config from {self.config_path}")
@@ -84,43 +524,52 @@ class RingTextGenerator:
             self.log(f"ERROR: Failed to load config: {e}", "ERROR")
             return False
     
+    def read_config_cache(self):
+        """Load the validated config from the cache file if it is still current"""
+        try:
+            cache = _loads(self.cache_path.read_bytes())
+            if cache['key'] != self._cache_key:
+                return False
+            
+            # The font may have been replaced or removed since the config was validated
+            config = cache['config']
+            if os.path.getmtime(config['text']['_resolved_font_path']) != cache['font_mtime']:
+                return False
+        except Exception:
+            return False
+        
+        self.config = config
+        self.config_validated = True
+        return True
+    
+    def write_config_cache(self):
+        """Store the validated config for later runs on the same file"""
+        try:
+            cache = {
+                "key": self._cache_key,
+                "font_mtime": os.path.getmtime(self.config['text']['_resolved_font_path']),
+                "config": self.config
+            }
+            self.cache_path.write_bytes(_dumps(cache))
+        except Exception as e:
+            self.log(f"Warning: Could not write config cache: {e}", "WARNING")
+    
     def validate_config(self):
         """Validate all configuration parameters"""
-        # Check for required sections
-        required_sections = ['ring', 'text', 'output']
-        for section in required_sections:
-            if section not in self.config:
-                self.log(f"ERROR: Missing required section: {section}", "ERROR")
-                return False
+        # Structural checks: required fields, types, ranges and enums
+        schema_error = _schema_error(self._config_data)
+        if schema_error:
+            self.log(f"ERROR: Invalid configuration: {schema_error}", "ERROR")
+            return False
         
-        # Validate ring section
         ring_config = self.config['ring']
-        required_ring_fields = ['inner_diameter', 'outer_diameter', 'length']
-        
-        for field in required_ring_fields:
-            if field not in ring_config:
-                self.log(f"ERROR: Missing required ring field: {field}", "ERROR")
-                return False
         
         # Set ring defaults
         ring_config.setdefault('radial_segments', 256)
         ring_config.setdefault('vertical_segments', 64)
         
-        # Validate text section
         text_config = self.config['text']
-        
-        required_text_fields = ['content', 'font_path', 'font_size', 'depth', 'direction']
-        
-        for field in required_text_fields:
-            if field not in text_config:
-                self.log(f"ERROR: Missing required text field: {field}", "ERROR")
-                return False
-        
-        # Validate output section
         output_config = self.config['output']
-        if 'stl_filename' not in output_config:
-            self.log("ERROR: Missing required output field: stl_filename", "ERROR")
-            return False
         
         # Set output defaults
         output_config.setdefault('create_parent_dirs', True)
@@ -131,11 +580,6 @@ class RingTextGenerator:
             # Set default density if not specified (PLA default)
             material_config.setdefault('density', 1.24)  # g/cm³
             material_config.setdefault('name', 'PLA')
-            
-            # Validate density
-            if material_config['density'] <= 0:
-                self.log("ERROR: Material density must be positive", "ERROR")
-                return False
         else:
             # Create default material config
             self.config['material'] = {
@@ -176,11 +620,6 @@ class RingTextGenerator:
         # Validate ring dimensions
         inner_d = ring_config['inner_diameter']
         outer_d = ring_config['outer_diameter']
-        length = ring_config['length']
-        
-        if inner_d <= 0 or outer_d <= 0 or length <= 0:
-            self.log("ERROR: Ring dimensions must be positive", "ERROR")
-            return False
         
         if inner_d >= outer_d:
             self.log(f"ERROR: Inner diameter ({inner_d}) must be less than outer diameter ({outer_d})", "ERROR")
@@ -199,37 +638,6 @@ class RingTextGenerator:
         if ring_thickness < 1.5:
             self.log(f"WARNING: Ring thickness ({ring_thickness}mm) is less than recommended minimum of 1.5mm", "WARNING")
         
-        # Validate font_size
-        font_size = text_config['font_size']
-        if font_size <= 0:
-            self.log("ERROR: Font size must be positive", "ERROR")
-            return False
-        
-        # Validate text depth
-        text_depth = text_config['depth']
-        
-        if text_depth <= 0:
-            self.log("ERROR: Text depth must be positive", "ERROR")
-            return False
-
-        # Validate text direction
-        text_direction = text_config.get('direction', 'normal')
-        if text_direction not in ['normal', 'inverted']:
-            self.log(f"ERROR: Invalid text direction '{text_direction}', must be 'normal' or 'inverted'", "ERROR")
-            return False
-        
-        # Validate segment counts
-        radial_segments = ring_config['radial_segments']
-        vertical_segments = ring_config['vertical_segments']
-        
-        if radial_segments < 128:
-            self.log(f"ERROR: radial_segments ({radial_segments}) must be >= 128", "ERROR")
-            return False
-        
-        if vertical_segments < 32:
-            self.log(f"ERROR: vertical_segments ({vertical_segments}) must be >= 32", "ERROR")
-            return False
-        
         # Resolve output file paths
         output_path = output_config['stl_filename']
         if not os.path.isabs(output_path):
@@ -243,6 +651,16 @@ class RingTextGenerator:
                 report_path = self.config_dir / report_path
             output_config['_resolved_report_path'] = str(Path(report_path).resolve())
         
+        if not self.create_output_dirs():
+            return False
+        
+        self.log("Configuration validation successful")
+        return True
+    
+    def create_output_dirs(self):
+        """Create parent directories of the output and report files"""
+        output_config = self.config['output']
+        
         # Create parent directories if needed
         output_dir = Path(output_config['_resolved_output_path']).parent
         if output_config.get('create_parent_dirs', True) and output_dir:
@@ -262,31 +680,22 @@ class RingTextGenerator:
                     self.log(f"ERROR: Could not create report directory: {e}", "ERROR")
                     return False
         
-        self.log("Configuration validation successful")
         return True
     
     def clear_scene(self):
         """Clear all objects from the scene"""
         self.log("Clearing scene...")
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
-        
-        # Clear mesh data
-        for mesh in bpy.data.meshes:
-            bpy.data.meshes.remove(mesh)
-        
-        # Clear curves
-        for curve in bpy.data.curves:
-            bpy.data.curves.remove(curve)
-        
-        # Clear fonts
-        for font in bpy.data.fonts:
-            bpy.data.fonts.remove(font)
+        # Remove objects, mesh data, curves and fonts in one batch, without the select/delete operators
+        ids = [*bpy.data.objects, *bpy.data.meshes, *bpy.data.curves]
+        if not self.keep_fonts:
+            ids.extend(bpy.data.fonts)
+        bpy.data.batch_remove(ids=ids)
             
         self.log("Scene cleared")
     
     def create_ring(self):
         """Create the ring cylinder mesh"""
+        import numpy as np
         ring_config = self.config['ring']
         inner_radius = ring_config['inner_diameter'] / 2
         outer_radius = ring_config['outer_diameter'] / 2
@@ -301,82 +710,10 @@ class RingTextGenerator:
         ring_obj = bpy.data.objects.new("Ring", mesh)
         bpy.context.collection.objects.link(ring_obj)
         
-        # Create geometry using bmesh for better control
-        bm = bmesh.new()
-        
-        # Create vertices for rings at different heights
-        for v_idx in range(vertical_segments + 1):
-            z = -length/2 + (length * v_idx / vertical_segments)
-            
-            # Outer circle
-            for r_idx in range(radial_segments):
-                angle = 2 * math.pi * r_idx / radial_segments
-                x = outer_radius * math.cos(angle)
-                y = outer_radius * math.sin(angle)
-                bm.verts.new((x, y, z))
-            
-            # Inner circle
-            for r_idx in range(radial_segments):
-                angle = 2 * math.pi * r_idx / radial_segments
-                x = inner_radius * math.cos(angle)
-                y = inner_radius * math.sin(angle)
-                bm.verts.new((x, y, z))
-        
-        bm.verts.ensure_lookup_table()
-        
-        # Create faces
-        verts_per_ring = radial_segments * 2
-        
-        # Side faces
-        for v_idx in range(vertical_segments):
-            ring_offset = v_idx * verts_per_ring
-            next_ring_offset = (v_idx + 1) * verts_per_ring
-            
-            # Outer surface
-            for r_idx in range(radial_segments):
-                next_r = (r_idx + 1) % radial_segments
-                v1 = bm.verts[ring_offset + r_idx]
-                v2 = bm.verts[ring_offset + next_r]
-                v3 = bm.verts[next_ring_offset + next_r]
-                v4 = bm.verts[next_ring_offset + r_idx]
-                bm.faces.new([v1, v2, v3, v4])
-            
-            # Inner surface
-            for r_idx in range(radial_segments):
-                next_r = (r_idx + 1) % radial_segments
-                v1 = bm.verts[ring_offset + radial_segments + r_idx]
-                v2 = bm.verts[next_ring_offset + radial_segments + r_idx]
-                v3 = bm.verts[next_ring_offset + radial_segments + next_r]
-                v4 = bm.verts[ring_offset + radial_segments + next_r]
-                bm.faces.new([v1, v2, v3, v4])
-        
-        # Top face
-        top_offset = vertical_segments * verts_per_ring
-        for r_idx in range(radial_segments):
-            next_r = (r_idx + 1) % radial_segments
-            v1 = bm.verts[top_offset + r_idx]
-            v2 = bm.verts[top_offset + next_r]
-            v3 = bm.verts[top_offset + radial_segments + next_r]
-            v4 = bm.verts[top_offset + radial_segments + r_idx]
-            bm.faces.new([v1, v2, v3, v4])
-        
-        # Bottom face
-        for r_idx in range(radial_segments):
-            next_r = (r_idx + 1) % radial_segments
-            v1 = bm.verts[r_idx]
-            v2 = bm.verts[radial_segments + r_idx]
-            v3 = bm.verts[radial_segments + next_r]
-            v4 = bm.verts[next_r]
-            bm.faces.new([v1, v2, v3, v4])
-        
-        # Update mesh
-        bm.to_mesh(mesh)
-        bm.free()
-        
-        # Apply smooth shading
-        ring_obj.select_set(True)
-        bpy.context.view_layer.objects.active = ring_obj
-        bpy.ops.object.shade_smooth()
+        # Build vertex and face arrays in bulk, then copy them into the mesh
+        verts, faces = build_ring_arrays(inner_radius, outer_radius, length,
+                                         radial_segments, vertical_segments)
+        fill_mesh(mesh, verts, faces.ravel(), np.arange(0, faces.size, 4, dtype=np.int32))
         
         self.log(f"Created ring: inner_d={ring_config['inner_diameter']}mm, "
                 f"outer_d={ring_config['outer_diameter']}mm, length={ring_config['length']}mm")
@@ -399,7 +736,7 @@ class RingTextGenerator:
         
         # Load font
         try:
-            font = bpy.data.fonts.load(font_path)
+            font = bpy.data.fonts.load(font_path, check_existing=True)
             self.log(f"Loaded font: {font_path}")
         except Exception as e:
             self.log(f"ERROR: Failed to load font: {e}", "ERROR")
@@ -420,20 +757,24 @@ class RingTextGenerator:
         # No letter spacing adjustment - let the font handle natural spacing
         # This preserves cursive connections
         
-        # Create text object
-        text_obj = bpy.data.objects.new("Text", curve)
-        bpy.context.collection.objects.link(text_obj)
-        
-        # Convert to mesh
-        text_obj.select_set(True)
-        bpy.context.view_layer.objects.active = text_obj
+        # Link a temporary curve object so the depsgraph can tessellate the font
+        curve_obj = bpy.data.objects.new("TextCurve", curve)
+        bpy.context.collection.objects.link(curve_obj)
         
+        # Convert to mesh from the evaluated curve, without the convert operator
         self.log("Converting text to mesh...")
-        bpy.ops.object.convert(target='MESH')
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh = bpy.data.meshes.new_from_object(curve_obj.evaluated_get(depsgraph))
+        mesh.name = "Text"
+        bpy.data.objects.remove(curve_obj, do_unlink=True)
+        bpy.data.curves.remove(curve)
         
-        # Apply initial rotation to make text face outward
-        text_obj.rotation_euler = (-math.pi/2, 0, 0)
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
+        # Create text object
+        text_obj = bpy.data.objects.new("Text", mesh)
+        bpy.context.collection.objects.link(text_obj)
+        
+        # The rotation that makes the text face outward is folded into
+        # curve_text_mesh, so no transform needs to be applied here
         
         # Curve the text around the ring
         success = self.curve_text_mesh(text_obj, outer_radius, text_direction)
@@ -446,21 +787,21 @@ class RingTextGenerator:
     
     def curve_text_mesh(self, text_obj, radius, text_direction):
         """Curve the text mesh around the ring with proper positioning"""
-        text_config = self.config['text']
+        import numpy as np
         mesh = text_obj.data
         
-        # Get text bounds
-        text_obj.select_set(True)
-        bpy.context.view_layer.objects.active = text_obj
+        # Read vertex coordinates once, for both the bounds and the deformation
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+        
+        # Rotate -90 degrees around X to make text face outward: (x, y, z) -> (x, z, -y)
+        co = co[:, [0, 2, 1]]
+        co[:, 2] *= -1
         
         # Calculate bounding box
-        bbox_corners = [text_obj.matrix_world @ Vector(corner) for corner in text_obj.bound_box]
-        min_x = min([v.x for v in bbox_corners])
-        max_x = max([v.x for v in bbox_corners])
-        min_y = min([v.y for v in bbox_corners])
-        max_y = max([v.y for v in bbox_corners])
-        min_z = min([v.z for v in bbox_corners])
-        max_z = max([v.z for v in bbox_corners])
+        min_x, min_y, min_z = co.min(axis=0)
+        max_x, max_y, max_z = co.max(axis=0)
         
         text_width = max_x - min_x
         text_depth_actual = max_y - min_y
@@ -486,82 +827,62 @@ class RingTextGenerator:
         self.log(f"Text depth range: {min_y:.3f} to {max_y:.3f}mm, applying offset: {y_offset:.3f}mm")
         
         # Apply curve deformation to vertices
-        for vertex in mesh.vertices:
-            x = vertex.co.x - text_center_x
-            y = vertex.co.y + y_offset  # Apply the offset to normalize position
-            z = vertex.co.z - text_center_z  # Center vertically
-            
-            # Check if vertex is within allowed range
-            if abs(x) > available_circumference / 2:
-                continue  # Skip vertices outside allowed range (truncation)
-            
-            # Calculate angle for this vertex
-            if text_direction == 'inverted':
-                # For inverted text, reverse the angle
-                angle = -(x / radius)
-            else:
-                # Normal text direction
-                angle = (x / radius)
-            
-            # Calculate radial position
-            # For embossed text, add to radius (going outward)
-            r = radius + y  # y will be >= 0, so this increases radius
-            
-            # Convert to cylindrical coordinates
-            # Position at +Y axis intersection as per spec
-            new_x = r * math.sin(angle)
-            new_y = r * math.cos(angle)
-            new_z = z
-            
-            vertex.co = Vector((new_x, new_y, new_z))
+        x = co[:, 0] - text_center_x
+        y = co[:, 1] + y_offset  # Apply the offset to normalize position
+        z = co[:, 2] - text_center_z  # Center vertically
+        
+        # Skip vertices outside allowed range (truncation)
+        inside = np.abs(x) <= available_circumference / 2
+        
+        # Calculate angle for each vertex; for inverted text, reverse the angle
+        sign = -1.0 if text_direction == 'inverted' else 1.0
+        angle = sign * (x / radius)
+        
+        # Calculate radial position
+        # For embossed text, add to radius (going outward)
+        r = radius + y  # y will be >= 0, so this increases radius
         
-        # Update mesh
-        mesh.update()
+        # Convert to cylindrical coordinates
+        # Position at +Y axis intersection as per spec
+        co[inside, 0] = (r * np.sin(angle))[inside]
+        co[inside, 1] = (r * np.cos(angle))[inside]
+        co[inside, 2] = z[inside]
         
-        # Ensure proper normals
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.normals_make_consistent(inside=False)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        mesh.vertices.foreach_set("co", co.ravel())
+        
+        # Update mesh and ensure proper normals, without entering edit mode
+        clean_mesh(mesh)
         
         return True
     
-    def calculate_mesh_volume(self, mesh_obj):
-        """Calculate the volume of a mesh object using bmesh"""
-        try:
-            # Get the mesh data
-            mesh = mesh_obj.data
+    def _triangulate_final(self, obj):
+        """Triangulate the final mesh once and cache its (verts, tris) arrays"""
+        import numpy as np
+        if self._triangles is None:
+            mesh = obj.data
+            mesh.calc_loop_triangles()
             
-            # Create bmesh from mesh
-            bm = bmesh.new()
-            bm.from_mesh(mesh)
+            verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", verts)
+            tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", tris)
             
-            # Ensure mesh is triangulated for accurate volume calculation
-            bmesh.ops.triangulate(bm, faces=bm.faces[:])
+            self._triangles = (verts.reshape(-1, 3), tris.reshape(-1, 3))
+        return self._triangles
+    
+    def calculate_mesh_volume(self, mesh_obj):
+        """Calculate the volume of a mesh object from its triangles"""
+        import numpy as np
+        try:
+            verts, tris = self._triangulate_final(mesh_obj)
             
             # Calculate volume using the divergence theorem
-            # Volume = (1/3) * sum of (face_normal · face_center) * face_area
-            volume = 0.0
-            
-            for face in bm.faces:
-                # Get face center
-                center = face.calc_center_median()
-                
-                # Get face normal
-                normal = face.normal
-                
-                # Get face area
-                area = face.calc_area()
-                
-                # Add contribution to volume
-                # The dot product gives us the signed distance from origin
-                volume += (center.dot(normal) * area) / 3.0
-            
-            # Clean up
-            bm.free()
+            # Volume = (1/6) * sum of v0 · (v1 × v2) over all triangles
+            corners = verts[tris].astype(np.float64)
+            volume = np.einsum('ij,ij->i', corners[:, 0], np.cross(corners[:, 1], corners[:, 2])).sum() / 6.0
             
             # Convert to positive value (in case normals were flipped)
-            volume = abs(volume)
+            volume = abs(float(volume))
             
             # Convert from cubic Blender units to cubic millimeters
             # (assuming 1 Blender unit = 1mm as per the script design)
@@ -574,7 +895,7 @@ class RingTextGenerator:
             
         except Exception as e:
             self.log(f"ERROR: Failed to calculate volume: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(lazy_traceback(e), "ERROR")
             return None, None
     
     def combine_ring_and_text(self, ring_obj, text_obj):
@@ -589,32 +910,9 @@ class RingTextGenerator:
             # Create a new mesh for the combined result
             combined_mesh = bpy.data.meshes.new(name="CombinedRing")
             
-            # Get vertex and face data from both meshes
-            ring_verts = [(v.co.x, v.co.y, v.co.z) for v in ring_mesh.vertices]
-            text_verts = [(v.co.x, v.co.y, v.co.z) for v in text_mesh.vertices]
-            
-            # Combine vertices
-            all_verts = ring_verts + text_verts
-            
-            # Get faces from ring mesh
-            ring_faces = []
-            for poly in ring_mesh.polygons:
-                face = [v for v in poly.vertices]
-                ring_faces.append(face)
-            
-            # Get faces from text mesh and offset indices
-            text_faces = []
-            vertex_offset = len(ring_verts)
-            for poly in text_mesh.polygons:
-                face = [v + vertex_offset for v in poly.vertices]
-                text_faces.append(face)
-            
-            # Combine faces
-            all_faces = ring_faces + text_faces
-            
-            # Create the combined mesh
-            combined_mesh.from_pydata(all_verts, [], all_faces)
-            combined_mesh.update()
+            # Counts before merging, for the summary log
+            vertex_count = len(ring_mesh.vertices) + len(text_mesh.vertices)
+            face_count = len(ring_mesh.polygons) + len(text_mesh.polygons)
             
             # Create new object with combined mesh
             combined_obj = bpy.data.objects.new("FinalRing", combined_mesh)
@@ -625,31 +923,19 @@ class RingTextGenerator:
                 for mat in ring_obj.data.materials:
                     combined_obj.data.materials.append(mat)
             
-            # Select and make active
-            bpy.ops.object.select_all(action='DESELECT')
-            combined_obj.select_set(True)
-            bpy.context.view_layer.objects.active = combined_obj
-            
-            # Clean up duplicate vertices at boundaries (optional but recommended)
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles(threshold=0.0001)
-            bpy.ops.mesh.normals_make_consistent(inside=False)
-            bpy.ops.object.mode_set(mode='OBJECT')
-            
-            # Apply smooth shading
-            bpy.ops.object.shade_smooth()
+            # Join both meshes and clean up duplicate vertices at boundaries in one bmesh pass
+            clean_mesh(combined_mesh, merge_distance=0.0001, others=(ring_mesh, text_mesh))
             
             # Delete the original objects
             bpy.data.objects.remove(ring_obj, do_unlink=True)
             bpy.data.objects.remove(text_obj, do_unlink=True)
             
-            self.log(f"Successfully merged meshes: {len(all_verts)} vertices, {len(all_faces)} faces")
+            self.log(f"Successfully merged meshes: {vertex_count} vertices, {face_count} faces")
             return combined_obj
             
         except Exception as e:
             self.log(f"ERROR: Failed to merge meshes: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(lazy_traceback(e), "ERROR")
             return None
     
     def write_json_report(self, volume_mm3, volume_cm3, weight_g):
@@ -690,75 +976,52 @@ class RingTextGenerator:
             }
             
             # Write JSON report
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            with open(report_path, 'wb') as f:
+                f.write(_dumps(report, indent=True))
             
             self.log(f"Written JSON report to: {report_path}")
             
         except Exception as e:
             self.log(f"ERROR: Failed to write JSON report: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(lazy_traceback(e), "ERROR")
     
     def export_stl(self, obj):
         """Export the final mesh as STL"""
         output_path = self.config['output']['_resolved_output_path']
         
-        # Calculate volume before export
-        self.log("Calculating mesh volume...")
-        volume_mm3, volume_cm3 = self.calculate_mesh_volume(obj)
-        
-        if volume_mm3 is not None:
-            # Get material properties
-            material_name = self.config['material']['name']
-            material_density = self.config['material']['density']  # g/cm³
-            
-            # Calculate weight
-            weight_g = volume_cm3 * material_density
-            
-            self.log(f"Mesh volume: {volume_mm3:.2f} mm³ ({volume_cm3:.3f} cm³)")
-            self.log(f"Material: {material_name} (density: {material_density} g/cm³)")
-            self.log(f"Estimated weight: {weight_g:.2f} g")
-            
-            # Write JSON report if configured
-            self.write_json_report(volume_mm3, volume_cm3, weight_g)
+        # Volume and weight only feed the report, so skip them when none is configured
+        volume_mm3 = volume_cm3 = weight_g = None
+        if '_resolved_report_path' not in self.config['output']:
+            self.log("No report file configured, skipping volume calculation")
         else:
-            self.log("WARNING: Could not calculate mesh volume", "WARNING")
-            weight_g = None
+            # Calculate volume before export
+            self.log("Calculating mesh volume...")
+            volume_mm3, volume_cm3 = self.calculate_mesh_volume(obj)
+            
+            if volume_mm3 is not None:
+                # Get material properties
+                material_name = self.config['material']['name']
+                material_density = self.config['material']['density']  # g/cm³
+                
+                # Calculate weight
+                weight_g = volume_cm3 * material_density
+                
+                self.log(f"Mesh volume: {volume_mm3:.2f} mm³ ({volume_cm3:.3f} cm³)")
+                self.log(f"Material: {material_name} (density: {material_density} g/cm³)")
+                self.log(f"Estimated weight: {weight_g:.2f} g")
+                
+                # Write JSON report
+                self.write_json_report(volume_mm3, volume_cm3, weight_g)
+            else:
+                self.log("WARNING: Could not calculate mesh volume", "WARNING")
         
         self.log(f"Exporting STL to: {output_path}")
         
         try:
-            # Select only the final object
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            bpy.context.view_layer.objects.active = obj
-            
-            # Ensure we have a mesh
-            if obj.type != 'MESH':
-                self.log("Converting object to mesh for export", "INFO")
-                bpy.ops.object.convert(target='MESH')
-            
-            # Try new export API first (Blender 3.3+)
-            try:
-                bpy.ops.wm.stl_export(
-                    filepath=output_path,
-                    export_selected_objects=True,
-                    ascii_format=False,
-                    apply_modifiers=True,
-                    global_scale=1.0
-                )
-                self.log("Exported using new STL export API")
-            except AttributeError:
-                # Fall back to old API
-                bpy.ops.export_mesh.stl(
-                    filepath=output_path,
-                    check_existing=False,
-                    use_selection=True,
-                    ascii=False,
-                    apply_modifiers=True,
-                    global_scale=1.0
-                )
-                self.log("Exported using legacy STL export API")
+            # Write binary STL from the triangles shared with the volume calculation
+            verts, tris = self._triangulate_final(obj)
+            write_stl_binary(output_path, verts, tris)
+            self.log(f"Exported {len(tris):,} triangles using direct STL writer")
             
             # Verify file was created
             if Path(output_path).exists():
@@ -784,8 +1047,52 @@ class RingTextGenerator:
             
         except Exception as e:
             self.log(f"ERROR: Failed to export STL: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(lazy_traceback(e), "ERROR")
+            return False
+    
+    def config_hash(self):
+        """Hash the validated config, generator version and font file, ignoring the force flag"""
+        config = dict(self.config)
+        config['output'] = {k: v for k, v in config['output'].items() if k != 'force'}
+        font_stat = os.stat(config['text']['_resolved_font_path'])
+        payload = {
+            'generator': GENERATOR_VERSION,
+            'font': [font_stat.st_mtime_ns, font_stat.st_size],
+            'config': config
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def output_is_current(self, config_hash):
+        """Check whether the outputs were already generated from this config"""
+        output_config = self.config['output']
+        hash_path = Path(f"{output_config['_resolved_output_path']}.hash")
+        
+        if output_config.get('force', False) or not hash_path.exists():
             return False
+        
+        outputs = [output_config['_resolved_output_path']]
+        if '_resolved_report_path' in output_config:
+            outputs.append(output_config['_resolved_report_path'])
+        if not all(Path(path).exists() for path in outputs):
+            return False
+        
+        try:
+            if hash_path.read_text(encoding='utf-8').strip() == config_hash:
+                return True
+            # Stale hash: drop it so a failed run cannot leave it next to a new output
+            hash_path.unlink()
+        except Exception as e:
+            self.log(f"Warning: Could not check output hash file: {e}", "WARNING")
+        return False
+    
+    def write_output_hash(self, config_hash):
+        """Record the config hash next to the output file"""
+        hash_path = Path(f"{self.config['output']['_resolved_output_path']}.hash")
+        try:
+            hash_path.write_text(config_hash + '\n', encoding='utf-8')
+        except Exception as e:
+            self.log(f"Warning: Could not write output hash file: {e}", "WARNING")
     
     def cleanup_on_error(self):
         """Clean up temporary files on error"""
@@ -807,9 +1114,21 @@ class RingTextGenerator:
             if not self.load_config():
                 return 2  # File I/O error
             
-            # Validate configuration
-            if not self.validate_config():
-                return 1  # Input validation error
+            # Validate configuration, or only recreate output directories for a cached config
+            if self.config_validated:
+                if not self.create_output_dirs():
+                    return 1  # Input validation error
+            else:
+                if not self.validate_config():
+                    return 1  # Input validation error
+                if self.use_cache:
+                    self.write_config_cache()
+            
+            # Skip generation when the outputs were already built from this config
+            config_hash = self.config_hash()
+            if self.output_is_current(config_hash):
+                self.log("Output is up to date with this config (cache hit), skipping generation")
+                return 0  # Success
             
             # Clear scene
             self.clear_scene()
@@ -841,40 +1160,167 @@ class RingTextGenerator:
                 self.cleanup_on_error()
                 return 2  # File I/O error
             
+            self.write_output_hash(config_hash)
             self.log("Ring generation completed successfully")
             return 0  # Success
             
         except Exception as e:
             self.log(f"ERROR: Unexpected error: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(lazy_traceback(e), "ERROR")
             self.cleanup_on_error()
-            return 3  # Blender operation error
+            self.error_class = type(e).__name__
+            return exit_code_for(e)
         finally:
             # Always ensure Blender is properly closed
             self.log("Cleaning up Blender resources...")
+            self.close_log()
 
 
-def main():
-    """Main entry point"""
-    # Get command line arguments
-    argv = sys.argv
+# Script arguments after Blender's "--" separator, or None when it is missing
+_POST_DD_ARGV = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else None
+
+DAEMON_SOCKET = "/tmp/ring-emboss.sock"
+DAEMON_IDLE_TIMEOUT = 300  # seconds without a job before the daemon exits
+DAEMON_REQUEST_TIMEOUT = 10  # seconds a client may take to send its request line
+
+
+def warm_up_fonts(font_paths):
+    """Load fonts and tessellate a sample text once, so the first daemon jobs start warm"""
+    for font_path in font_paths:
+        font_path = str(Path(font_path).resolve())
+        try:
+            font = bpy.data.fonts.load(font_path, check_existing=True)
+        except Exception as e:
+            print(f"Warning: Could not preload font {font_path}: {e}")
+            continue
+        
+        curve = bpy.data.curves.new(type="FONT", name="WarmUp")
+        curve.body = "Warm up"
+        curve.font = font
+        curve.extrude = 0.1
+        curve_obj = bpy.data.objects.new("WarmUp", curve)
+        bpy.context.collection.objects.link(curve_obj)
+        
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh = bpy.data.meshes.new_from_object(curve_obj.evaluated_get(depsgraph))
+        bpy.data.objects.remove(curve_obj, do_unlink=True)
+        bpy.data.curves.remove(curve)
+        bpy.data.meshes.remove(mesh)
+        print(f"Preloaded font: {font_path}")
+
+
+def serve_daemon(socket_path=DAEMON_SOCKET, idle_timeout=DAEMON_IDLE_TIMEOUT, font_paths=()):
+    """Keep Blender running and generate rings for configs sent over a Unix socket
+
+    Each request is one JSON line {"config": path, "no_cache": bool}; the
+    reply is one JSON line {"code": exit_code, "class": exception_name_or_null}.
+    Returns 2 without touching the socket when another daemon already owns it.
+    """
+    import select
+    import socket
+    import traceback
     
-    # Find the -- separator
-    if "--" not in argv:
+    if os.path.exists(socket_path):
+        # A socket file that still accepts connections belongs to a running daemon
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+        else:
+            print(f"ERROR: A ring daemon is already listening on {socket_path}")
+            return 2
+        finally:
+            probe.close()
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(f"Ring daemon listening on {socket_path}")
+    warm_up_fonts(font_paths)
+    
+    try:
+        while True:
+            readable, _, _ = select.select([server], [], [], idle_timeout)
+            if not readable:
+                print(f"No jobs for {idle_timeout} seconds, shutting down")
+                break
+            
+            conn, _ = server.accept()
+            with conn:
+                # A client that never sends a newline must not block later jobs
+                conn.settimeout(DAEMON_REQUEST_TIMEOUT)
+                try:
+                    with conn.makefile('rb') as f:
+                        request = json.loads(f.readline())
+                    config_path = request['config']
+                except (ValueError, KeyError, TypeError, OSError) as e:
+                    # OSError covers socket.timeout and clients that reset the connection
+                    print(f"ERROR: Invalid daemon request: {e}")
+                    try:
+                        conn.sendall(json.dumps({"code": 1, "class": type(e).__name__}).encode() + b'\n')
+                    except OSError:
+                        pass
+                    continue
+                
+                try:
+                    # clear_scene empties the scene for every job but keeps loaded fonts
+                    generator = RingTextGenerator(config_path, use_cache=not request.get('no_cache', False),
+                                                  keep_fonts=True)
+                    exit_code = generator.run()
+                    error_class = generator.error_class
+                except Exception as e:
+                    print(f"ERROR: Daemon job failed: {e}")
+                    print(f"Traceback: {traceback.format_exc()}")
+                    exit_code = exit_code_for(e)
+                    error_class = type(e).__name__
+                try:
+                    conn.sendall(json.dumps({"code": exit_code, "class": error_class}).encode() + b'\n')
+                except OSError:
+                    # The client went away before the reply; keep serving
+                    continue
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+    return 0
+
+
+def run_cli(argv):
+    """Run the script for the arguments after '--' and return the exit code"""
+    if argv is None:
         print("ERROR: No config file specified. Usage: blender --background --python script.py -- config.json")
-        sys.exit(1)
+        return 1
     
-    argv = argv[argv.index("--") + 1:]
+    if argv and argv[0] == "--daemon":
+        return serve_daemon(font_paths=argv[1:])
+    
+    # Optional flags may appear alongside the config path
+    use_cache = "--no-cache" not in argv
+    argv = [arg for arg in argv if arg != "--no-cache"]
     
     if len(argv) < 1:
-        print("ERROR: No config file specified. Usage: blender --background --python script.py -- config.json")
-        sys.exit(1)
+        print("ERROR: No config file specified. Usage: blender --background --python script.py -- config.json [--no-cache]")
+        return 1
     
     config_path = argv[0]
     
     # Create and run generator
-    generator = RingTextGenerator(config_path)
-    exit_code = generator.run()
+    generator = RingTextGenerator(config_path, use_cache=use_cache)
+    return generator.run()
+
+
+def main():
+    """Main entry point"""
+    exit_code = run_cli(_POST_DD_ARGV)
+    
+    # Optionally skip interpreter finalization. This is safe for the log file:
+    # run() ends with close_log(), which waits for the log thread to close it
+    if os.environ.get("RING_FAST_EXIT") == "1":
+        bpy.ops.wm.read_factory_settings(use_empty=True)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
     
     # Exit with appropriate code
     sys.exit(exit_code)
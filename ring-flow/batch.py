@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+batch.py - Generate rings for every config in a directory, one Blender process per core
+Runs outside Blender with: python3 batch.py configs_dir [--jobs N]
+Set BLENDER to the Blender executable if it is not on PATH.
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPT_PATH = Path(__file__).resolve().parent / "script.py"
+
+
+def run_blender(config_path):
+    """Run script.py on one config in its own Blender process and return the exit code"""
+    blender = os.environ.get("BLENDER", "blender")
+    command = [blender, "--background", "--python", str(SCRIPT_PATH), "--", str(config_path)]
+    try:
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        print(f"ERROR: Could not start Blender ({blender}): {e}")
+        return 2
+    return result.returncode
+
+
+def main():
+    """Run all configs in parallel and exit with the highest exit code, or 3 if a run was killed"""
+    argv = sys.argv[1:]
+    jobs = os.cpu_count() or 1
+    if "--jobs" in argv:
+        index = argv.index("--jobs")
+        try:
+            jobs = int(argv[index + 1])
+        except (IndexError, ValueError):
+            jobs = 0
+        if jobs < 1:
+            print("ERROR: --jobs needs a positive integer value")
+            sys.exit(1)
+        del argv[index:index + 2]
+    
+    if len(argv) < 1:
+        print("ERROR: No config directory specified. Usage: python3 batch.py configs_dir [--jobs N]")
+        sys.exit(1)
+    
+    config_paths = sorted(p for p in Path(argv[0]).glob("*.json") if not p.name.endswith(".cache.json"))
+    if not config_paths:
+        print(f"ERROR: No config files found in {argv[0]}")
+        sys.exit(1)
+    
+    # Each worker thread only waits on its Blender process, so threads are enough
+    print(f"Generating {len(config_paths)} rings with {jobs} parallel Blender processes")
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        exit_codes = list(pool.map(run_blender, config_paths))
+    
+    for config_path, exit_code in zip(config_paths, exit_codes):
+        status = "OK" if exit_code == 0 else f"FAILED (exit code {exit_code})"
+        print(f"  {config_path.name}: {status}")
+    
+    # A negative code means Blender was killed by a signal; report it as a Blender failure
+    sys.exit(max((code if code > 0 else 3 for code in exit_codes if code != 0), default=0))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,36 +11,216 @@ import sys
 import json
 import os
 import math
+import hashlib
+import numpy as np
+from collections import deque
 from pathlib import Path
 from datetime import datetime
-from mathutils import Vector, Matrix
-import traceback
+
+# orjson parses and serializes faster when installed; stdlib json is the fallback
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+def _dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, optionally indented by two spaces"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def build_partial_ring_verts(inner_r, outer_r, length, ring_start, ring_span, segments_for_arc, vertical_segments):
+    """Partial ring vertices (float32[N,3]): outer arc then inner arc for every height"""
+    angles = ring_start + ring_span * np.arange(segments_for_arc + 1) / segments_for_arc
+    cos_tab = np.cos(angles)
+    sin_tab = np.sin(angles)
+    z = -length / 2 + length * np.arange(vertical_segments + 1) / vertical_segments
+
+    verts = np.empty((vertical_segments + 1, 2, segments_for_arc + 1, 3), dtype=np.float32)
+    verts[:, 0, :, 0] = outer_r * cos_tab
+    verts[:, 0, :, 1] = outer_r * sin_tab
+    verts[:, 1, :, 0] = inner_r * cos_tab
+    verts[:, 1, :, 1] = inner_r * sin_tab
+    verts[..., 2] = z[:, None, None]
+    return verts.reshape(-1, 3)
+
+
+def build_partial_ring_faces(segments_for_arc, vertical_segments):
+    """Partial ring quads (int32[M,4]): sides per height, top, bottom, start cap, end cap"""
+    S = segments_for_arc
+    V = vertical_segments
+    verts_per_ring = (S + 1) * 2
+    inner_start = S + 1
+
+    r = np.arange(S, dtype=np.int32)
+    ring_offset = (np.arange(V, dtype=np.int32) * verts_per_ring)[:, None]
+    next_ring_offset = ring_offset + verts_per_ring
+    top_offset = V * verts_per_ring
+
+    # Side faces, outer then inner surface for every height
+    outer = np.stack([ring_offset + r, ring_offset + r + 1,
+                      next_ring_offset + r + 1, next_ring_offset + r], axis=-1)
+    inner = np.stack([ring_offset + inner_start + r, next_ring_offset + inner_start + r,
+                      next_ring_offset + inner_start + r + 1, ring_offset + inner_start + r + 1], axis=-1)
+    sides = np.stack([outer, inner], axis=1).reshape(-1, 4)
+
+    top = np.stack([top_offset + r, top_offset + r + 1,
+                    top_offset + inner_start + r + 1, top_offset + inner_start + r], axis=-1)
+    bottom = np.stack([r, inner_start + r, inner_start + r + 1, r + 1], axis=-1)
+
+    # End caps where the arc starts and ends
+    ring_offset = ring_offset[:, 0]
+    next_ring_offset = next_ring_offset[:, 0]
+    start_cap = np.stack([ring_offset, ring_offset + inner_start,
+                          next_ring_offset + inner_start, next_ring_offset], axis=-1)
+    end_cap = np.stack([ring_offset + S, next_ring_offset + S,
+                        next_ring_offset + inner_start + S, ring_offset + inner_start + S], axis=-1)
+
+    return np.concatenate([sides, top, bottom, start_cap, end_cap]).astype(np.int32, copy=False)
+
+
+def fill_mesh(mesh, verts, loop_verts, loop_start):
+    """Fill an empty mesh from flat vertex, loop and polygon buffers"""
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(len(loop_verts))
+    mesh.polygons.add(len(loop_start))
+    mesh.attributes["position"].data.foreach_set("vector", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loop_verts, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(loop_start, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+
+def clean_mesh(mesh, merge_distance=None, others=()):
+    """Optionally join other meshes into mesh and merge close vertices, then make face normals point outward"""
+    bm = bmesh.new()
+    bm.from_mesh(mesh)
+    # from_mesh appends to the bmesh, so the other meshes are joined without an intermediate copy
+    for other in others:
+        bm.from_mesh(other)
+    if merge_distance is not None:
+        bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=merge_distance)
+    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+    bm.to_mesh(mesh)
+    bm.free()
+    mesh.update()
+
+
+def write_stl_binary(path, verts, tris):
+    """Write indexed triangles to a binary STL file"""
+    corners = verts[tris]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+    
+    records = np.zeros(len(tris), dtype=[('normal', '<f4', (3,)), ('verts', '<f4', (3, 3)), ('attr', '<u2')])
+    records['normal'] = normals
+    records['verts'] = corners
+    
+    with open(path, 'wb') as f:
+        f.write(b'Binary STL written by ring-flow script.py'.ljust(80, b' '))
+        np.array([len(tris)], dtype='<u4').tofile(f)
+        records.tofile(f)
+
+
+def format_traceback():
+    """Format the exception being handled; traceback is only imported on error paths"""
+    import traceback
+    return traceback.format_exc()
+
+
+# Numba is optional; the compiled text curving kernel is created on first use
+_curve_kernel = None
+
+
+def _curve_text_kernel(co, center_x, y_offset, z_offset, inner_radius, radius, sign):
+    """Map text vertices around the ring in place (compiled by Numba)"""
+    for i in range(co.shape[0]):
+        angle = sign * (co[i, 0] - center_x) / radius
+        r = inner_radius + co[i, 1] + y_offset
+        co[i, 0] = r * math.sin(angle)
+        co[i, 1] = r * math.cos(angle)
+        co[i, 2] = co[i, 2] + z_offset
+
+
+def _get_curve_kernel():
+    """Return the Numba-compiled text curving kernel, or None if Numba is unavailable"""
+    global _curve_kernel
+    if _curve_kernel is None:
+        try:
+            import numba
+        except ImportError:
+            _curve_kernel = False
+        else:
+            try:
+                _curve_kernel = numba.njit(cache=True, fastmath=True)(_curve_text_kernel)
+            except Exception as e:
+                # cache=True raises here when no writable cache directory can be found
+                print(f"Warning: Could not set up Numba curve kernel, using NumPy instead: {e}")
+                _curve_kernel = False
+    return _curve_kernel or None
+
+
+def _run_curve_kernel(co, center_x, y_offset, z_offset, inner_radius, radius, sign):
+    """Curve text vertices in place with the Numba kernel; return False if NumPy must be used"""
+    global _curve_kernel
+    kernel = _get_curve_kernel()
+    if kernel is None:
+        return False
+    try:
+        kernel(co, center_x, y_offset, z_offset, inner_radius, radius, sign)
+    except Exception as e:
+        # Compilation happens on the first call, so typing or cache errors show up here
+        print(f"Warning: Numba curve kernel failed, using NumPy instead: {e}")
+        _curve_kernel = False
+        return False
+    return True
+
+
+# Bump when validate_config changes what it stores in the config dict
+CONFIG_CACHE_VERSION = 1
+
 
 class RingTextGenerator:
     def __init__(self, config_path):
         self.config_path = Path(config_path).resolve()
         self.config_dir = self.config_path.parent
         self.config = None
-        self.log_messages = []
+        self.cache_path = self.config_path.with_suffix('.cache.json')
+        self._config_hash = None
+        self.config_validated = False
+        self.log_messages = deque(maxlen=10000)  # Most recent lines only
         self.log_file = None
+        self._log_handle = None  # Kept open for the whole run, closed by close_log
         self.report_data = {}  # Store data for JSON report
         self.text_start_angle = None  # Will store where text starts
         self.text_end_angle = None    # Will store where text ends
+        self._triangles = None  # Triangulated final mesh
         
     def log(self, message, level="INFO"):
         """Log message to console and file"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         formatted_msg = f"[{timestamp}] [{level}] {message}"
-        print(formatted_msg)
+        sys.stdout.write(formatted_msg + '\n')
         self.log_messages.append(formatted_msg)
         
-        if self.log_file:
+        if self._log_handle:
             try:
-                with open(self.log_file, 'a') as f:
-                    f.write(formatted_msg + '\n')
+                self._log_handle.write(formatted_msg + '\n')
+                if level == "ERROR":
+                    self._log_handle.flush()
             except Exception as e:
                 print(f"Warning: Could not write to log file: {e}")
     
+    def close_log(self):
+        """Flush and close the log file"""
+        if self._log_handle:
+            self._log_handle.close()
+            self._log_handle = None
+    
     def setup_log_file(self):
         """Initialize log file from config"""
         if 'output' in self.config and 'log_filename' in self.config['output']:
@@ -60,10 +240,10 @@ class RingTextGenerator:
             
             # Create log file and write header
             try:
-                with open(self.log_file, 'w') as f:
-                    f.write(f"Ring Text Generator Log - Started at {datetime.now()}\n")
-                    f.write(f"Config file: {self.config_path}\n")
-                    f.write("-" * 60 + "\n")
+                self._log_handle = open(self.log_file, 'w')
+                self._log_handle.write(f"Ring Text Generator Log - Started at {datetime.now()}\n")
+                self._log_handle.write(f"Config file: {self.config_path}\n")
+                self._log_handle.write("-" * 60 + "\n")
             except Exception as e:
                 print(f"Warning: Could not create log file: {e}")
                 self.log_file = None
@@ -71,8 +251,17 @@ class RingTextGenerator:
     def load_config(self):
         """Load and parse configuration JSON"""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            config_bytes = self.config_path.read_bytes()
+            key = f"{CONFIG_CACHE_VERSION}:{self.config_path}:".encode('utf-8') + config_bytes
+            self._config_hash = hashlib.blake2b(key).hexdigest()
+            
+            # Reuse the validated config from a previous run if the content is unchanged
+            if self.read_config_cache():
+                self.setup_log_file()
+                self.log(f"Loaded validated config from cache {self.cache_path}")
+                return True
+            
+            self.config = _loads(config_bytes)
             
             self.setup_log_file()
             self.log(f"Successfully loaded config from {self.config_path}")
@@ -87,8 +276,50 @@ class RingTextGenerator:
             self.log(f"ERROR: Failed to load config: {e}", "ERROR")
             return False
     
+    def read_config_cache(self):
+        """Load the validated config from the cache file if it is still current"""
+        try:
+            cache = _loads(self.cache_path.read_bytes())
+            if cache['hash'] != self._config_hash:
+                return False
+            
+            # The font may have been replaced since the config was validated
+            config = cache['config']
+            if os.path.getmtime(config['text']['_resolved_font_path']) != cache['font_mtime']:
+                return False
+        except Exception:
+            return False
+        
+        self.config = config
+        self.config_validated = True
+        return True
+    
+    def write_config_cache(self):
+        """Store the validated config for later runs on the same content"""
+        try:
+            cache = {
+                "hash": self._config_hash,
+                "font_mtime": os.path.getmtime(self.config['text']['_resolved_font_path']),
+                "config": self.config
+            }
+            self.cache_path.write_bytes(_dumps(cache))
+        except Exception as e:
+            self.log(f"Warning: Could not write config cache: {e}", "WARNING")
+    
     def validate_config(self):
         """Validate all configuration parameters"""
+        # Pure checks first, so an invalid config never creates directories
+        if not self._check_config():
+            return False
+        
+        if not self._apply_paths():
+            return False
+        
+        self.log("Configuration validation successful")
+        return True
+    
+    def _check_config(self):
+        """Check fields, ranges and text content and fill in defaults, without touching the filesystem"""
         # Check for required sections
         required_sections = ['ring', 'text', 'output']
         for section in required_sections:
@@ -164,25 +395,6 @@ class RingTextGenerator:
                 'density': 1.24  # g/cm³
             }
         
-        # Validate font path
-        font_path = text_config['font_path']
-        if not os.path.isabs(font_path):
-            # Use Path for proper cross-platform handling
-            font_path = (self.config_dir / font_path).resolve()
-        else:
-            font_path = Path(font_path).resolve()
-
-        if not font_path.exists():
-            self.log(f"ERROR: Font file not found: {font_path}", "ERROR")
-            return False
-
-        if not font_path.suffix.lower() in ['.ttf', '.otf']:
-            self.log(f"ERROR: Font file must be TTF or OTF format: {font_path}", "ERROR")
-            return False
-
-        # Store the resolved path as a string for Blender
-        text_config['_resolved_font_path'] = str(font_path)
-        
         # Validate text content
         text = text_config['content']
         if not text or len(text.strip()) == 0:
@@ -258,58 +470,77 @@ class RingTextGenerator:
             self.log(f"ERROR: vertical_segments ({vertical_segments}) must be >= 32", "ERROR")
             return False
         
+        return True
+    
+    def _apply_paths(self):
+        """Resolve font, output and report paths and create output directories"""
+        text_config = self.config['text']
+        output_config = self.config['output']
+        
+        # Validate font path
+        font_path = self._resolve_path(text_config['font_path'])
+
+        try:
+            os.stat(font_path)
+        except OSError:
+            self.log(f"ERROR: Font file not found: {font_path}", "ERROR")
+            return False
+
+        if not font_path.lower().endswith(('.ttf', '.otf')):
+            self.log(f"ERROR: Font file must be TTF or OTF format: {font_path}", "ERROR")
+            return False
+
+        # Store the resolved path as a string for Blender
+        text_config['_resolved_font_path'] = font_path
+        
         # Resolve output file paths
-        output_path = output_config['stl_filename']
-        if not os.path.isabs(output_path):
-            output_path = self.config_dir / output_path
-        output_config['_resolved_output_path'] = str(Path(output_path).resolve())
+        output_config['_resolved_output_path'] = self._resolve_path(output_config['stl_filename'])
         
         # Resolve report file path if specified
         if 'report_filename' in output_config:
-            report_path = output_config['report_filename']
-            if not os.path.isabs(report_path):
-                report_path = self.config_dir / report_path
-            output_config['_resolved_report_path'] = str(Path(report_path).resolve())
+            output_config['_resolved_report_path'] = self._resolve_path(output_config['report_filename'])
+        
+        if not self.create_output_dirs():
+            return False
+        
+        return True
+    
+    def _resolve_path(self, path):
+        """Resolve a config path against the config directory, once, as a string"""
+        # Joining an absolute path replaces the directory, so no isabs check is needed
+        return str((self.config_dir / path).resolve())
+    
+    def create_output_dirs(self):
+        """Create parent directories of the output and report files"""
+        output_config = self.config['output']
+        if not output_config.get('create_parent_dirs', True):
+            return True
+        
+        # Output and report usually share a directory, so each directory is checked once
+        dirs = {}
+        for key, kind in (('_resolved_output_path', 'output'), ('_resolved_report_path', 'report')):
+            if key in output_config:
+                dirs.setdefault(os.path.dirname(output_config[key]), kind)
         
         # Create parent directories if needed
-        output_dir = Path(output_config['_resolved_output_path']).parent
-        if output_config.get('create_parent_dirs', True) and output_dir:
+        for directory, kind in dirs.items():
+            if os.path.isdir(directory):
+                continue
             try:
-                output_dir.mkdir(parents=True, exist_ok=True)
+                os.makedirs(directory, exist_ok=True)
             except Exception as e:
-                self.log(f"ERROR: Could not create output directory: {e}", "ERROR")
+                self.log(f"ERROR: Could not create {kind} directory: {e}", "ERROR")
                 return False
         
-        # Create report directory if needed
-        if '_resolved_report_path' in output_config:
-            report_dir = Path(output_config['_resolved_report_path']).parent
-            if output_config.get('create_parent_dirs', True) and report_dir:
-                try:
-                    report_dir.mkdir(parents=True, exist_ok=True)
-                except Exception as e:
-                    self.log(f"ERROR: Could not create report directory: {e}", "ERROR")
-                    return False
-        
-        self.log("Configuration validation successful")
         return True
     
     def clear_scene(self):
         """Clear all objects from the scene"""
         self.log("Clearing scene...")
-        bpy.ops.object.select_all(action='SELECT')
-        bpy.ops.object.delete()
-        
-        # Clear mesh data
-        for mesh in bpy.data.meshes:
-            bpy.data.meshes.remove(mesh)
-        
-        # Clear curves
-        for curve in bpy.data.curves:
-            bpy.data.curves.remove(curve)
+        # Remove objects, mesh data and curves in one batch, without the select/delete operators
+        bpy.data.batch_remove(ids=[*bpy.data.objects, *bpy.data.meshes, *bpy.data.curves])
         
-        # Clear fonts
-        for font in bpy.data.fonts:
-            bpy.data.fonts.remove(font)
+        # Fonts are kept so later runs in the same session reuse them
             
         self.log("Scene cleared")
     
@@ -327,7 +558,7 @@ class RingTextGenerator:
 
         # Load the font
         try:
-            font = bpy.data.fonts.load(font_path)
+            font = bpy.data.fonts.load(font_path, check_existing=True)
         except Exception as e:
             self.log(f"ERROR: Failed to load font from {font_path}: {e}", "ERROR")
             return None
@@ -347,25 +578,33 @@ class RingTextGenerator:
         text_curve.bevel_depth = 0.04  # Small bevel (in Blender units)
         text_curve.bevel_resolution = 2  # Low resolution for performance
 
+        # Link a temporary curve object so the depsgraph can tessellate the font
+        curve_obj = bpy.data.objects.new("TextCurve", text_curve)
+        bpy.context.collection.objects.link(curve_obj)
+
+        # Convert to mesh from the evaluated curve, without the convert operator
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh = bpy.data.meshes.new_from_object(curve_obj.evaluated_get(depsgraph))
+        mesh.name = "Text"
+        bpy.data.objects.remove(curve_obj, do_unlink=True)
+        bpy.data.curves.remove(text_curve)
+
         # Create text object
-        text_obj = bpy.data.objects.new("Text", text_curve)
+        text_obj = bpy.data.objects.new("Text", mesh)
         bpy.context.collection.objects.link(text_obj)
 
-        # Convert to mesh
-        text_obj.select_set(True)
-        bpy.context.view_layer.objects.active = text_obj
-        bpy.ops.object.convert(target='MESH')
-
-        # Apply rotation to align text properly
-        text_obj.rotation_euler[0] = math.radians(-90)  # Rotate -90 degrees around X
-        bpy.ops.object.transform_apply(rotation=True, scale=True)
+        # Rotate -90 degrees around X to align text properly, (x, y, z) -> (x, z, -y),
+        # directly on the vertices instead of through transform_apply
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)[:, [0, 2, 1]]
+        co[:, 2] *= -1
+        mesh.vertices.foreach_set("co", co.ravel())
+        mesh.update()
 
-        # Get the width of the text
-        bpy.ops.object.mode_set(mode='OBJECT')
-        bbox_corners = [text_obj.matrix_world @ Vector(corner) for corner in text_obj.bound_box]
-        min_x = min([v.x for v in bbox_corners])
-        max_x = max([v.x for v in bbox_corners])
-        text_width = max_x - min_x
+        # Get the text bounds once from the rotated vertices
+        bounds = (co.min(axis=0).astype(np.float64), co.max(axis=0).astype(np.float64))
+        text_width = float(bounds[1][0] - bounds[0][0])
 
         # Calculate the arc that the text will occupy
         text_angle_span = text_width / outer_radius
@@ -381,7 +620,7 @@ class RingTextGenerator:
         self.log(f"Text angular span: {math.degrees(text_angle_span):.2f}°")
 
         # Curve the text around the ring
-        success = self.curve_text_mesh(text_obj, outer_radius, text_direction)
+        success = self.curve_text_mesh(text_obj, outer_radius, text_direction, bounds)
 
         if success:
             self.log(f"Created embossed text: '{text[:50]}{'...' if len(text) > 50 else ''}'")
@@ -394,48 +633,41 @@ class RingTextGenerator:
         mesh = mesh_obj.data
         mesh.update()
         
-        # Initialize vertex weights
-        vertex_weights = [0.0] * len(mesh.vertices)
+        # Read polygon areas and sizes, loop vertex indices and coordinates
+        areas = np.empty(len(mesh.polygons), dtype=np.float32)
+        mesh.polygons.foreach_get("area", areas)
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        z = co[2::3].astype(np.float64)
         
-        # Calculate area contribution for each vertex
-        for poly in mesh.polygons:
-            area = poly.area
-            area_per_vertex = area / len(poly.vertices)
-            
-            for vertex_index in poly.vertices:
-                vertex_weights[vertex_index] += area_per_vertex
+        # Each polygon gives an equal share of its area to each of its vertices
+        area_per_loop = np.repeat(areas.astype(np.float64) / loop_totals, loop_totals)
+        vertex_weights = np.bincount(loop_verts, weights=area_per_loop, minlength=len(z))
         
         # Calculate weighted average
-        total_weighted_z = 0.0
-        total_weight = 0.0
-        
-        for i, vertex in enumerate(mesh.vertices):
-            weight = vertex_weights[i]
-            total_weighted_z += vertex.co.z * weight
-            total_weight += weight
+        total_weight = vertex_weights.sum()
         
         if total_weight > 0:
-            return total_weighted_z / total_weight
+            return float(np.dot(z, vertex_weights) / total_weight)
         else:
             # Fallback to simple average
-            return sum(v.co.z for v in mesh.vertices) / len(mesh.vertices)
+            return float(z.mean())
+
+    def curve_text_mesh(self, text_obj, radius, text_direction, bounds):
+        """Curve the text mesh around the ring with proper positioning
 
-    def curve_text_mesh(self, text_obj, radius, text_direction):
-        """Curve the text mesh around the ring with proper positioning"""
+        bounds is the (min, max) corner pair of the text bounding box.
+        """
         text_config = self.config['text']
         ring_config = self.config['ring']  # Add this to access ring dimensions
         mesh = text_obj.data
 
-        # Get text bounds
-        text_obj.select_set(True)
-        bpy.context.view_layer.objects.active = text_obj
-
         # Auto-center text vertically on ring using vertex-based centroid
-        bbox_corners = [text_obj.matrix_world @ Vector(corner) for corner in text_obj.bound_box]
-        min_x = min([v.x for v in bbox_corners])
-        max_x = max([v.x for v in bbox_corners])
-        min_y = min([v.y for v in bbox_corners])
-        max_y = max([v.y for v in bbox_corners])
+        (min_x, min_y, _), (max_x, max_y, _) = bounds
         
         text_center_x = (min_x + max_x) / 2
         
@@ -456,19 +688,27 @@ class RingTextGenerator:
         self.log(f"Positioning text at inner radius: {inner_radius:.2f}mm")
         self.log(f"Total Z offset: {total_z_offset:.3f}mm")
 
-        # Apply curve deformation to vertices
-        for vertex in mesh.vertices:
-            x = vertex.co.x - text_center_x
-            y = vertex.co.y + y_offset  # Apply the offset to normalize position
-            z = vertex.co.z + total_z_offset  # Apply total Z offset (alignment + user offset)
+        # Read all vertex coordinates at once
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3)
 
-            # Calculate angle for this vertex
-            if text_direction == 'inverted':
-                # For inverted text, reverse the angle
-                angle = -(x / radius)
-            else:
-                # Normal text direction
-                angle = (x / radius)
+        # For inverted text, reverse the angle
+        sign = -1.0 if text_direction == 'inverted' else 1.0
+
+        # Deform the buffer in place with Numba when available, without NumPy temporaries
+        if _run_curve_kernel(co, text_center_x, y_offset, total_z_offset, inner_radius, radius, sign):
+            curved = co
+        else:
+            co = co.astype(np.float64)
+
+            # Apply curve deformation to vertices
+            x = co[:, 0] - text_center_x
+            y = co[:, 1] + y_offset  # Apply the offset to normalize position
+            z = co[:, 2] + total_z_offset  # Apply total Z offset (alignment + user offset)
+
+            # Calculate angle for each vertex
+            angle = sign * (x / radius)
 
             # Calculate radial position
             # Position text at inner radius level
@@ -476,20 +716,11 @@ class RingTextGenerator:
 
             # Convert to cylindrical coordinates
             # Position at +Y axis intersection as per spec
-            new_x = r * math.sin(angle)
-            new_y = r * math.cos(angle)
-            new_z = z
-
-            vertex.co = Vector((new_x, new_y, new_z))
-
-        # Update mesh
-        mesh.update()
+            curved = np.column_stack([r * np.sin(angle), r * np.cos(angle), z]).astype(np.float32)
+        mesh.vertices.foreach_set("co", curved.ravel())
 
-        # Ensure proper normals
-        bpy.ops.object.mode_set(mode='EDIT')
-        bpy.ops.mesh.select_all(action='SELECT')
-        bpy.ops.mesh.normals_make_consistent(inside=False)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Update mesh and ensure proper normals
+        clean_mesh(mesh)
 
         return True
 
@@ -509,87 +740,58 @@ class RingTextGenerator:
 
         self.log(f"Text has {num_letters} letters, junction_angle_diff = {math.degrees(junction_angle_diff):.2f}°")
 
-        def get_vertices_in_range(angle_min, angle_max):
-            """Get vertices within specified angular range"""
-            vertices_in_range = []
-
-            for vertex in mesh.vertices:
-                x, y, z = vertex.co
-
-                # Calculate polar coordinates
-                radius = math.sqrt(x*x + y*y)
-
-                # Since angle 0 is at +X and positive direction is from +X towards +Y
-                # We use standard atan2(y, x) but need to handle the coordinate system
-                angle = math.atan2(y, x)
+        # Read vertex coordinates and polygon data once for both ranges
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3).astype(np.float64)
+        x, y, z = co[:, 0], co[:, 1], co[:, 2]
+
+        # Calculate polar coordinates
+        radius = np.hypot(x, y)
+
+        # Since angle 0 is at +X and positive direction is from +X towards +Y
+        # We use standard atan2(y, x), normalized to [0, 2*pi]
+        angle = np.mod(np.arctan2(y, x), 2 * math.pi)
+
+        # Vertices within the ring's radial and vertical extent (inclusive boundaries)
+        in_ring = ((ring_inner_radius <= radius) & (radius <= ring_outer_radius) &
+                   (-ring_length/2 <= z) & (z <= ring_length/2))
+
+        # Each polygon gives an equal share of its area to each of its vertices
+        areas = np.empty(len(mesh.polygons), dtype=np.float32)
+        mesh.polygons.foreach_get("area", areas)
+        loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        area_per_loop = np.repeat(areas.astype(np.float64) / loop_totals, loop_totals)
+        vertex_weights = np.bincount(loop_verts, weights=area_per_loop, minlength=len(co))
 
-                # Normalize angle to [0, 2*pi]
-                if angle < 0:
-                    angle += 2 * math.pi
-
-                # Check if vertex is within the spatial range (inclusive boundaries)
-                if (angle_min <= angle <= angle_max and
-                    ring_inner_radius <= radius <= ring_outer_radius and
-                    -ring_length/2 <= z <= ring_length/2):
-                    vertices_in_range.append(vertex)
-
-            return vertices_in_range
+        def get_vertices_in_range(angle_min, angle_max):
+            """Get indices of vertices within specified angular range"""
+            return np.nonzero(in_ring & (angle_min <= angle) & (angle <= angle_max))[0]
 
-        def calculate_angle_centroid_area_weighted(vertices):
+        def calculate_angle_centroid_area_weighted(indices):
             """Calculate area-weighted angle centroid of vertices"""
-            if not vertices:
+            if indices.size == 0:
                 return None
 
-            # Build vertex index set for quick lookup
-            vertex_indices = {v.index for v in vertices}
-
-            # Initialize vertex weights
-            vertex_weights = {v.index: 0.0 for v in vertices}
-
-            # Calculate area contribution for each vertex
-            for poly in mesh.polygons:
-                # Check if polygon has any vertices in our set
-                poly_vertices_in_set = [v for v in poly.vertices if v in vertex_indices]
-
-                if poly_vertices_in_set:
-                    area = poly.area
-                    area_per_vertex = area / len(poly.vertices)
-
-                    for vertex_index in poly_vertices_in_set:
-                        vertex_weights[vertex_index] += area_per_vertex
-
-            # Calculate weighted average angle
-            total_weighted_x = 0.0
-            total_weighted_y = 0.0
-            total_weight = 0.0
-
-            for vertex in vertices:
-                weight = vertex_weights[vertex.index]
-                if weight > 0:
-                    x, y, z = vertex.co
-                    total_weighted_x += x * weight
-                    total_weighted_y += y * weight
-                    total_weight += weight
+            weights = vertex_weights[indices]
+            total_weight = weights.sum()
 
             if total_weight > 0:
                 # Calculate angle from weighted centroid
-                centroid_x = total_weighted_x / total_weight
-                centroid_y = total_weighted_y / total_weight
-                angle = math.atan2(centroid_y, centroid_x)
-                # Normalize to [0, 2*pi]
-                if angle < 0:
-                    angle += 2 * math.pi
-                return angle
+                centroid_x = np.dot(x[indices], weights) / total_weight
+                centroid_y = np.dot(y[indices], weights) / total_weight
             else:
                 # Fallback to simple average
-                sum_x = sum(v.co.x for v in vertices)
-                sum_y = sum(v.co.y for v in vertices)
-                if sum_x == 0 and sum_y == 0:
+                centroid_x = x[indices].sum()
+                centroid_y = y[indices].sum()
+                if centroid_x == 0 and centroid_y == 0:
                     return None
-                angle = math.atan2(sum_y, sum_x)
-                if angle < 0:
-                    angle += 2 * math.pi
-                return angle
+
+            # Normalize to [0, 2*pi]
+            return float(math.atan2(centroid_y, centroid_x) % (2 * math.pi))
 
         # Calculate overlap for text start
         start_range_min = text_start_angle
@@ -664,144 +866,47 @@ class RingTextGenerator:
         ring_obj = bpy.data.objects.new("PartialRing", mesh)
         bpy.context.collection.objects.link(ring_obj)
 
-        # Create geometry using bmesh
-        bm = bmesh.new()
-
-        # Create vertices for rings at different heights
-        for v_idx in range(vertical_segments + 1):
-            z = -length/2 + (length * v_idx / vertical_segments)
-
-            # Outer circle arc
-            for r_idx in range(segments_for_arc + 1):
-                angle = ring_start + (ring_span * r_idx / segments_for_arc)
-                x = outer_radius * math.cos(angle)
-                y = outer_radius * math.sin(angle)
-                bm.verts.new((x, y, z))
-
-            # Inner circle arc
-            for r_idx in range(segments_for_arc + 1):
-                angle = ring_start + (ring_span * r_idx / segments_for_arc)
-                x = inner_radius * math.cos(angle)
-                y = inner_radius * math.sin(angle)
-                bm.verts.new((x, y, z))
-
-        bm.verts.ensure_lookup_table()
-
-        # Create faces
-        verts_per_ring = (segments_for_arc + 1) * 2
-
-        # Side faces
-        for v_idx in range(vertical_segments):
-            ring_offset = v_idx * verts_per_ring
-            next_ring_offset = (v_idx + 1) * verts_per_ring
-
-            # Outer surface
-            for r_idx in range(segments_for_arc):
-                v1 = bm.verts[ring_offset + r_idx]
-                v2 = bm.verts[ring_offset + r_idx + 1]
-                v3 = bm.verts[next_ring_offset + r_idx + 1]
-                v4 = bm.verts[next_ring_offset + r_idx]
-                bm.faces.new([v1, v2, v3, v4])
-
-            # Inner surface
-            inner_start = segments_for_arc + 1
-            for r_idx in range(segments_for_arc):
-                v1 = bm.verts[ring_offset + inner_start + r_idx]
-                v2 = bm.verts[next_ring_offset + inner_start + r_idx]
-                v3 = bm.verts[next_ring_offset + inner_start + r_idx + 1]
-                v4 = bm.verts[ring_offset + inner_start + r_idx + 1]
-                bm.faces.new([v1, v2, v3, v4])
-
-        # Top face
-        top_offset = vertical_segments * verts_per_ring
-        for r_idx in range(segments_for_arc):
-            v1 = bm.verts[top_offset + r_idx]
-            v2 = bm.verts[top_offset + r_idx + 1]
-            v3 = bm.verts[top_offset + segments_for_arc + 1 + r_idx + 1]
-            v4 = bm.verts[top_offset + segments_for_arc + 1 + r_idx]
-            bm.faces.new([v1, v2, v3, v4])
-
-        # Bottom face
-        for r_idx in range(segments_for_arc):
-            v1 = bm.verts[r_idx]
-            v2 = bm.verts[segments_for_arc + 1 + r_idx]
-            v3 = bm.verts[segments_for_arc + 1 + r_idx + 1]
-            v4 = bm.verts[r_idx + 1]
-            bm.faces.new([v1, v2, v3, v4])
-
-        # End caps (where the arc starts and ends)
-        # Start cap
-        for v_idx in range(vertical_segments):
-            ring_offset = v_idx * verts_per_ring
-            next_ring_offset = (v_idx + 1) * verts_per_ring
-
-            v1 = bm.verts[ring_offset + 0]  # outer, current height
-            v2 = bm.verts[ring_offset + segments_for_arc + 1]  # inner, current height
-            v3 = bm.verts[next_ring_offset + segments_for_arc + 1]  # inner, next height
-            v4 = bm.verts[next_ring_offset + 0]  # outer, next height
-            bm.faces.new([v1, v2, v3, v4])
-
-        # End cap
-        for v_idx in range(vertical_segments):
-            ring_offset = v_idx * verts_per_ring
-            next_ring_offset = (v_idx + 1) * verts_per_ring
-
-            v1 = bm.verts[ring_offset + segments_for_arc]  # outer, current height
-            v2 = bm.verts[next_ring_offset + segments_for_arc]  # outer, next height
-            v3 = bm.verts[next_ring_offset + segments_for_arc + 1 + segments_for_arc]  # inner, next height
-            v4 = bm.verts[ring_offset + segments_for_arc + 1 + segments_for_arc]  # inner, current height
-            bm.faces.new([v1, v2, v3, v4])
+        # Create vertices for rings at different heights, outer arc then inner arc
+        verts = build_partial_ring_verts(inner_radius, outer_radius, length,
+                                         ring_start, ring_span, segments_for_arc, vertical_segments)
 
-        # Update mesh
-        bm.to_mesh(mesh)
-        bm.free()
+        # Create side, top, bottom and end cap faces as vertex index quads
+        faces = build_partial_ring_faces(segments_for_arc, vertical_segments)
 
-        # Apply smooth shading
-        ring_obj.select_set(True)
-        bpy.context.view_layer.objects.active = ring_obj
-        bpy.ops.object.shade_smooth()
+        # Update mesh
+        fill_mesh(mesh, verts, faces.ravel(), np.arange(0, faces.size, 4, dtype=np.int32))
 
         self.log(f"Created partial ring with inner_d={ring_config['inner_diameter']}mm, "
                 f"outer_d={ring_config['outer_diameter']}mm, length={ring_config['length']}mm")
 
         return ring_obj
     
-    def calculate_mesh_volume(self, mesh_obj):
-        """Calculate the volume of a mesh object using bmesh"""
-        try:
-            # Get the mesh data
-            mesh = mesh_obj.data
+    def _triangulate_final(self, obj):
+        """Triangulate the final mesh once and cache its (verts, tris) arrays"""
+        if self._triangles is None:
+            mesh = obj.data
+            mesh.calc_loop_triangles()
             
-            # Create bmesh from mesh
-            bm = bmesh.new()
-            bm.from_mesh(mesh)
+            verts = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", verts)
+            tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+            mesh.loop_triangles.foreach_get("vertices", tris)
             
-            # Ensure mesh is triangulated for accurate volume calculation
-            bmesh.ops.triangulate(bm, faces=bm.faces[:])
+            self._triangles = (verts.reshape(-1, 3), tris.reshape(-1, 3))
+        return self._triangles
+    
+    def calculate_mesh_volume(self, mesh_obj):
+        """Calculate the volume of a mesh object from its triangles"""
+        try:
+            verts, tris = self._triangulate_final(mesh_obj)
             
             # Calculate volume using the divergence theorem
-            # Volume = (1/3) * sum of (face_normal · face_center) * face_area
-            volume = 0.0
-            
-            for face in bm.faces:
-                # Get face center
-                center = face.calc_center_median()
-                
-                # Get face normal
-                normal = face.normal
-                
-                # Get face area
-                area = face.calc_area()
-                
-                # Add contribution to volume
-                # The dot product gives us the signed distance from origin
-                volume += (center.dot(normal) * area) / 3.0
-            
-            # Clean up
-            bm.free()
+            # Volume = (1/6) * sum of v0 · (v1 × v2) over all triangles
+            corners = verts[tris].astype(np.float64)
+            volume = np.einsum('ij,ij->i', corners[:, 0], np.cross(corners[:, 1], corners[:, 2])).sum() / 6.0
             
             # Convert to positive value (in case normals were flipped)
-            volume = abs(volume)
+            volume = abs(float(volume))
             
             # Convert from cubic Blender units to cubic millimeters
             # (assuming 1 Blender unit = 1mm as per the script design)
@@ -814,11 +919,11 @@ class RingTextGenerator:
             
         except Exception as e:
             self.log(f"ERROR: Failed to calculate volume: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(f"Traceback: {format_traceback()}", "ERROR")
             return None, None
     
     def combine_ring_and_text(self, ring_obj, text_obj):
-        """Combine ring and text by merging meshes directly"""
+        """Combine ring and text by appending the text mesh to the ring mesh"""
         self.log("Merging ring and text meshes...")
         
         try:
@@ -826,70 +931,26 @@ class RingTextGenerator:
             ring_mesh = ring_obj.data
             text_mesh = text_obj.data
             
-            # Create a new mesh for the combined result
-            combined_mesh = bpy.data.meshes.new(name="CombinedRing")
-            
-            # Get vertex and face data from both meshes
-            ring_verts = [(v.co.x, v.co.y, v.co.z) for v in ring_mesh.vertices]
-            text_verts = [(v.co.x, v.co.y, v.co.z) for v in text_mesh.vertices]
-            
-            # Combine vertices
-            all_verts = ring_verts + text_verts
-            
-            # Get faces from ring mesh
-            ring_faces = []
-            for poly in ring_mesh.polygons:
-                face = [v for v in poly.vertices]
-                ring_faces.append(face)
-            
-            # Get faces from text mesh and offset indices
-            text_faces = []
-            vertex_offset = len(ring_verts)
-            for poly in text_mesh.polygons:
-                face = [v + vertex_offset for v in poly.vertices]
-                text_faces.append(face)
-            
-            # Combine faces
-            all_faces = ring_faces + text_faces
+            # The ring mesh grows in place; the ring object becomes the final object
+            vertex_count = len(ring_mesh.vertices) + len(text_mesh.vertices)
+            face_count = len(ring_mesh.polygons) + len(text_mesh.polygons)
+            ring_mesh.name = "CombinedRing"
+            ring_obj.name = "FinalRing"
+            combined_obj = ring_obj
             
-            # Create the combined mesh
-            combined_mesh.from_pydata(all_verts, [], all_faces)
-            combined_mesh.update()
+            # Join the text and clean up duplicate vertices at boundaries in one bmesh pass
+            clean_mesh(ring_mesh, merge_distance=0.0001, others=(text_mesh,))
             
-            # Create new object with combined mesh
-            combined_obj = bpy.data.objects.new("FinalRing", combined_mesh)
-            bpy.context.collection.objects.link(combined_obj)
-            
-            # Copy materials if any
-            if len(ring_obj.data.materials) > 0:
-                for mat in ring_obj.data.materials:
-                    combined_obj.data.materials.append(mat)
-            
-            # Select and make active
-            bpy.ops.object.select_all(action='DESELECT')
-            combined_obj.select_set(True)
-            bpy.context.view_layer.objects.active = combined_obj
-            
-            # Clean up duplicate vertices at boundaries (optional but recommended)
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.remove_doubles(threshold=0.0001)
-            bpy.ops.mesh.normals_make_consistent(inside=False)
-            bpy.ops.object.mode_set(mode='OBJECT')
-            
-            # Apply smooth shading
-            bpy.ops.object.shade_smooth()
-            
-            # Delete the original objects
-            bpy.data.objects.remove(ring_obj, do_unlink=True)
+            # Delete the text object and its mesh
             bpy.data.objects.remove(text_obj, do_unlink=True)
+            bpy.data.meshes.remove(text_mesh)
             
-            self.log(f"Successfully merged meshes: {len(all_verts)} vertices, {len(all_faces)} faces")
+            self.log(f"Successfully merged meshes: {vertex_count} vertices, {face_count} faces")
             return combined_obj
             
         except Exception as e:
             self.log(f"ERROR: Failed to merge meshes: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(f"Traceback: {format_traceback()}", "ERROR")
             return None
     
     def write_json_report(self, volume_mm3, volume_cm3, weight_g):
@@ -938,75 +999,52 @@ class RingTextGenerator:
                 }
             
             # Write JSON report
-            with open(report_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            with open(report_path, 'wb') as f:
+                f.write(_dumps(report, indent=True))
             
             self.log(f"Written JSON report to: {report_path}")
             
         except Exception as e:
             self.log(f"ERROR: Failed to write JSON report: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(f"Traceback: {format_traceback()}", "ERROR")
     
     def export_stl(self, obj):
         """Export the final mesh as STL"""
         output_path = self.config['output']['_resolved_output_path']
         
-        # Calculate volume before export
-        self.log("Calculating mesh volume...")
-        volume_mm3, volume_cm3 = self.calculate_mesh_volume(obj)
-        
-        if volume_mm3 is not None:
-            # Get material properties
-            material_name = self.config['material']['name']
-            material_density = self.config['material']['density']  # g/cm³
-            
-            # Calculate weight
-            weight_g = volume_cm3 * material_density
-            
-            self.log(f"Mesh volume: {volume_mm3:.2f} mm³ ({volume_cm3:.3f} cm³)")
-            self.log(f"Material: {material_name} (density: {material_density} g/cm³)")
-            self.log(f"Estimated weight: {weight_g:.2f} g")
-            
-            # Write JSON report if configured
-            self.write_json_report(volume_mm3, volume_cm3, weight_g)
+        # Volume and weight only feed the report, so skip them when none is configured
+        volume_mm3 = volume_cm3 = weight_g = None
+        if '_resolved_report_path' not in self.config['output']:
+            self.log("No report file configured, skipping volume calculation")
         else:
-            self.log("WARNING: Could not calculate mesh volume", "WARNING")
-            weight_g = None
+            # Calculate volume before export
+            self.log("Calculating mesh volume...")
+            volume_mm3, volume_cm3 = self.calculate_mesh_volume(obj)
+            
+            if volume_mm3 is not None:
+                # Get material properties
+                material_name = self.config['material']['name']
+                material_density = self.config['material']['density']  # g/cm³
+                
+                # Calculate weight
+                weight_g = volume_cm3 * material_density
+                
+                self.log(f"Mesh volume: {volume_mm3:.2f} mm³ ({volume_cm3:.3f} cm³)")
+                self.log(f"Material: {material_name} (density: {material_density} g/cm³)")
+                self.log(f"Estimated weight: {weight_g:.2f} g")
+                
+                # Write JSON report
+                self.write_json_report(volume_mm3, volume_cm3, weight_g)
+            else:
+                self.log("WARNING: Could not calculate mesh volume", "WARNING")
         
         self.log(f"Exporting STL to: {output_path}")
         
         try:
-            # Select only the final object
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            bpy.context.view_layer.objects.active = obj
-            
-            # Ensure we have a mesh
-            if obj.type != 'MESH':
-                self.log("Converting object to mesh for export", "INFO")
-                bpy.ops.object.convert(target='MESH')
-            
-            # Try new export API first (Blender 3.3+)
-            try:
-                bpy.ops.wm.stl_export(
-                    filepath=output_path,
-                    export_selected_objects=True,
-                    ascii_format=False,
-                    apply_modifiers=True,
-                    global_scale=1.0
-                )
-                self.log("Exported using new STL export API")
-            except AttributeError:
-                # Fall back to old API
-                bpy.ops.export_mesh.stl(
-                    filepath=output_path,
-                    check_existing=False,
-                    use_selection=True,
-                    ascii=False,
-                    apply_modifiers=True,
-                    global_scale=1.0
-                )
-                self.log("Exported using legacy STL export API")
+            # Write binary STL from the triangles shared with the volume calculation
+            verts, tris = self._triangulate_final(obj)
+            write_stl_binary(output_path, verts, tris)
+            self.log(f"Exported {len(tris):,} triangles using direct STL writer")
             
             # Verify file was created
             if Path(output_path).exists():
@@ -1032,7 +1070,7 @@ class RingTextGenerator:
             
         except Exception as e:
             self.log(f"ERROR: Failed to export STL: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(f"Traceback: {format_traceback()}", "ERROR")
             return False
     
     def cleanup_on_error(self):
@@ -1055,9 +1093,14 @@ class RingTextGenerator:
             if not self.load_config():
                 return 2  # File I/O error
             
-            # Validate configuration
-            if not self.validate_config():
-                return 1  # Input validation error
+            # Validate configuration, or only recreate output directories for a cached config
+            if self.config_validated:
+                if not self.create_output_dirs():
+                    return 1  # Input validation error
+            else:
+                if not self.validate_config():
+                    return 1  # Input validation error
+                self.write_config_cache()
             
             # Clear scene
             self.clear_scene()
@@ -1094,12 +1137,13 @@ class RingTextGenerator:
             
         except Exception as e:
             self.log(f"ERROR: Unexpected error: {e}", "ERROR")
-            self.log(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.log(f"Traceback: {format_traceback()}", "ERROR")
             self.cleanup_on_error()
             return 3  # Blender operation error
         finally:
             # Always ensure Blender is properly closed
             self.log("Cleaning up Blender resources...")
+            self.close_log()
 
 
 def main():